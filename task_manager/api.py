@@ -0,0 +1,186 @@
+from collections import defaultdict
+
+from django.http import JsonResponse
+from django.views import View
+
+from task_manager.labels.models import Label
+from task_manager.mixins import ApiAuthMixin, ReplicaReadMixin
+from task_manager.pagination import InvalidCursor, KeysetPaginator
+from task_manager.statuses.models import Status
+from task_manager.tasks.filters import TaskFilter
+from task_manager.tasks.models import Task, TaskLabelLinks
+from task_manager.tasks.search import search_ordering
+from task_manager.users.models import User
+
+
+class InvalidParameter(Exception):
+    pass
+
+
+def split_param(value):
+    return [item for item in value.split(',') if item] if value else []
+
+
+class ApiView(ApiAuthMixin, ReplicaReadMixin, View):
+    """Read-only JSON list of ``model`` rows, read with ``values()``.
+
+    ``fields=`` limits the fields returned (and the columns read),
+    ``ids=`` looks up a batch of objects by id, ``cursor=`` and ``limit=``
+    page through the rest. Invalid parameters give a 400 JSON error.
+    """
+
+    model = None
+    # returned field -> column, None for fields added by serialize()
+    fields = {'id': 'id', 'name': 'name', 'created_at': 'created_at'}
+    cursor_ordering = ('id',)
+    paginate_by = 50
+    max_limit = 200
+
+    def get(self, request, *args, **kwargs):
+        try:
+            return JsonResponse(self.get_data())
+        except InvalidCursor:
+            return self.error('Invalid cursor')
+        except InvalidParameter as error:
+            return self.error(error.args[0])
+
+    def error(self, message):
+        return JsonResponse({'error': message}, status=400)
+
+    def get_data(self):
+        fields = self.get_fields()
+        queryset = self.get_queryset()
+        ids = self.get_ids()
+        if ids:
+            rows = queryset.filter(pk__in=ids).order_by('pk').values(
+                *self.get_columns(fields)
+            )
+            return {'results': self.serialize(rows, fields)}
+        ordering = self.get_cursor_ordering(queryset)
+        paginator = KeysetPaginator(
+            queryset.values(*self.get_columns(fields, ordering)),
+            self.get_limit(), ordering=ordering,
+        )
+        page = paginator.get_page(self.request.GET.get('cursor'))
+        return {
+            'results': self.serialize(page.object_list, fields),
+            'next': page.next_cursor,
+            'previous': page.previous_cursor,
+        }
+
+    def get_queryset(self):
+        return self.model._default_manager.all()
+
+    def get_cursor_ordering(self, queryset):
+        return self.cursor_ordering
+
+    def get_fields(self):
+        fields = split_param(self.request.GET.get('fields')) or self.fields
+        unknown = set(fields) - set(self.fields)
+        if unknown:
+            raise InvalidParameter(
+                f'Unknown fields: {", ".join(sorted(unknown))}'
+            )
+        return list(dict.fromkeys(fields))
+
+    def get_columns(self, fields, ordering=()):
+        columns = [self.fields[name] for name in fields if self.fields[name]]
+        ordering = [name.lstrip('-') for name in ordering]
+        return list(dict.fromkeys(['id', *columns, *ordering]))
+
+    def get_ids(self):
+        try:
+            ids = [int(pk) for pk in split_param(self.request.GET.get('ids'))]
+        except ValueError:
+            raise InvalidParameter('Invalid ids')
+        if len(ids) > self.max_limit:
+            raise InvalidParameter(f'At most {self.max_limit} ids')
+        return ids
+
+    def get_limit(self):
+        try:
+            limit = int(self.request.GET.get('limit', self.paginate_by))
+        except ValueError:
+            return self.paginate_by
+        return min(max(limit, 1), self.max_limit)
+
+    def serialize(self, rows, fields):
+        return [
+            {name: row[self.fields[name]] for name in fields}
+            for row in rows
+        ]
+
+
+class TasksApiView(ApiView):
+    model = Task
+    fields = {
+        'id': 'id',
+        'name': 'name',
+        'description': 'description',
+        'status': 'status_id',
+        'author': 'author_id',
+        'executor': 'executor_id',
+        'labels': None,
+        'created_at': 'created_at',
+        'updated_at': 'updated_at',
+    }
+    cursor_ordering = ('created_at', 'id')
+
+    def get_queryset(self):
+        filterset = TaskFilter(
+            self.request.GET, queryset=Task.objects.all(),
+            request=self.request,
+        )
+        if not filterset.is_valid():
+            raise InvalidParameter({
+                field: [error['message'] for error in errors]
+                for field, errors in filterset.errors.get_json_data().items()
+            })
+        return filterset.qs
+
+    def get_cursor_ordering(self, queryset):
+        if 'search_rank' in queryset.query.annotations:
+            return search_ordering(queryset)
+        return self.cursor_ordering
+
+    def serialize(self, rows, fields):
+        rows = list(rows)
+        labels = task_label_ids([row['id'] for row in rows]) \
+            if 'labels' in fields else {}
+        return [
+            {
+                name: labels.get(row['id'], []) if name == 'labels'
+                else row[self.fields[name]]
+                for name in fields
+            }
+            for row in rows
+        ]
+
+
+def task_label_ids(task_ids):
+    labels = defaultdict(list)
+    links = TaskLabelLinks.objects.filter(task_id__in=task_ids).values_list(
+        'task_id', 'label_id'
+    ).order_by('task_id', 'label_id')
+    for task_id, label_id in links:
+        labels[task_id].append(label_id)
+    return labels
+
+
+class StatusesApiView(ApiView):
+    model = Status
+
+
+class LabelsApiView(ApiView):
+    model = Label
+
+
+class UsersApiView(ApiView):
+    model = User
+    fields = {
+        'id': 'id',
+        'username': 'username',
+        'first_name': 'first_name',
+        'last_name': 'last_name',
+        'date_joined': 'date_joined',
+    }
@@ -0,0 +1,23 @@
+from django.apps import AppConfig
+from django.core.signals import request_finished, request_started
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
+
+
+class TaskManagerConfig(AppConfig):
+    name = 'task_manager'
+
+    def ready(self):
+        from task_manager import routers
+        from task_manager.autocomplete import register_lower
+        from task_manager.refdata import (
+            SNAPSHOT_FIELDS, finish_request, invalidate, start_request,
+        )
+
+        connection_created.connect(register_lower)
+        request_started.connect(start_request)
+        request_finished.connect(finish_request)
+        request_finished.connect(routers.finish_request)
+        for model in SNAPSHOT_FIELDS:
+            post_save.connect(invalidate, sender=model)
+            post_delete.connect(invalidate, sender=model)
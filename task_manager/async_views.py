@@ -0,0 +1,79 @@
+from django.conf import settings
+from django.http import Http404
+from django.views import View
+from django.views.generic.detail import (
+    SingleObjectMixin, SingleObjectTemplateResponseMixin,
+)
+from django.views.generic.list import (
+    MultipleObjectMixin, MultipleObjectTemplateResponseMixin,
+)
+
+
+def select_view(sync_view, async_view):
+    return async_view if settings.ASYNC_VIEWS else sync_view
+
+
+class AsyncListView(
+    MultipleObjectTemplateResponseMixin,
+    MultipleObjectMixin,
+    View
+):
+    """ListView that loads its objects through the async ORM API."""
+
+    pagination = None, None, False
+
+    async def get(self, request, *args, **kwargs):
+        self.object_list = await self.aget_object_list(self.get_queryset())
+        context = await self.aget_context_data()
+        return self.render_to_response(context)
+
+    async def aget_object_list(self, queryset):
+        self.object_list = queryset
+        page_size = self.get_paginate_by(queryset)
+        if not page_size:
+            return [obj async for obj in queryset]
+        paginator, page, object_list, is_paginated = (
+            await self.apaginate_queryset(queryset, page_size)
+        )
+        self.pagination = paginator, page, is_paginated
+        return object_list
+
+    async def aget_context_data(self, **kwargs):
+        return self.get_context_data(**kwargs)
+
+    def get_context_data(self, **kwargs):
+        paginator, page, is_paginated = self.pagination
+        context = {
+            'paginator': paginator,
+            'page_obj': page,
+            'is_paginated': is_paginated,
+            'object_list': self.object_list,
+        }
+        context_object_name = self.get_context_object_name(self.object_list)
+        if context_object_name is not None:
+            context[context_object_name] = self.object_list
+        context.update(kwargs)
+        return super(MultipleObjectMixin, self).get_context_data(**context)
+
+
+class AsyncDetailView(
+    SingleObjectTemplateResponseMixin,
+    SingleObjectMixin,
+    View
+):
+    """DetailView that loads its object through the async ORM API."""
+
+    async def get(self, request, *args, **kwargs):
+        self.object = await self.aget_object()
+        context = self.get_context_data(object=self.object)
+        return self.render_to_response(context)
+
+    async def aget_object(self):
+        queryset = self.get_queryset()
+        try:
+            return await queryset.aget(pk=self.kwargs[self.pk_url_kwarg])
+        except queryset.model.DoesNotExist:
+            raise Http404(
+                f'No {queryset.model._meta.verbose_name} found matching '
+                'the query'
+            )
@@ -0,0 +1,77 @@
+from functools import reduce
+from operator import or_
+
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.http import JsonResponse
+from django.views import View
+
+from task_manager.labels.models import Label
+from task_manager.mixins import AuthCheckMixin
+from task_manager.statuses.models import Status
+from task_manager.users.models import User
+
+
+def lower(value):
+    return value.lower() if isinstance(value, str) else value
+
+
+def register_lower(sender, connection, **kwargs):
+    # SQLite's LOWER() folds ASCII only, search terms go through str.lower()
+    if connection.vendor == 'sqlite':
+        connection.connection.create_function(
+            'LOWER', 1, lower, deterministic=True,
+        )
+
+
+def prefix_q(lookup, prefix):
+    prefix = prefix.lower()
+    upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    return Q(**{
+        f'{lookup}__gte': prefix,
+        f'{lookup}__lt': upper,
+        f'{lookup}__startswith': prefix,
+    })
+
+
+def prefix_search(queryset, fields, query, words=False):
+    lookups = {f'{field}_lower': Lower(field) for field in fields}
+    queryset = queryset.alias(**lookups)
+    for prefix in query.split() if words else filter(None, [query]):
+        queryset = queryset.filter(
+            reduce(or_, (prefix_q(lookup, prefix) for lookup in lookups))
+        )
+    return queryset.order_by(next(iter(lookups)), 'pk')
+
+
+class AutocompleteView(AuthCheckMixin, View):
+    model = None
+    search_fields = ('name',)
+    search_words = False
+    limit = 20
+
+    def get(self, request, *args, **kwargs):
+        queryset = prefix_search(
+            self.model._default_manager.only('pk', *self.search_fields),
+            self.search_fields,
+            request.GET.get('q', '').strip(),
+            words=self.search_words,
+        )
+        return JsonResponse({'results': [
+            {'id': obj.pk, 'text': str(obj)}
+            for obj in queryset[:self.limit]
+        ]})
+
+
+class StatusAutocompleteView(AutocompleteView):
+    model = Status
+
+
+class LabelAutocompleteView(AutocompleteView):
+    model = Label
+
+
+class UserAutocompleteView(AutocompleteView):
+    model = User
+    search_fields = ('first_name', 'last_name', 'username')
+    search_words = True
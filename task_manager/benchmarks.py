@@ -0,0 +1,22 @@
+import statistics
+
+from django.core.management.base import CommandError
+
+from task_manager.seed import PREFIX
+from task_manager.users.models import User
+
+
+def percentiles(timings, points=(50, 95, 99)):
+    if len(timings) < 2:
+        return tuple(timings[0] for _ in points)
+    cuts = statistics.quantiles(timings, n=100, method='inclusive')
+    return tuple(cuts[point - 1] for point in points)
+
+
+def benchmark_user(username=None):
+    users = User.objects.order_by('pk')
+    user = users.filter(username=username).first() if username \
+        else users.filter(username__startswith=f'{PREFIX}_').first()
+    if user is None:
+        raise CommandError('No user to log in as, run seed_bench first.')
+    return user
@@ -0,0 +1,117 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.filebased import FileBasedCache
+
+from task_manager.metrics import registry
+
+MISSING = object()
+
+
+class TieredCache:
+    """A per-process cache in front of a cache shared by all workers.
+
+    Without ``shared_alias`` only the per-process tier is used.
+    """
+
+    def __init__(self, local_alias='local', shared_alias='default'):
+        self.local_alias = local_alias
+        self.shared_alias = shared_alias
+
+    @property
+    def local(self):
+        return caches[self.local_alias]
+
+    @property
+    def shared(self):
+        return caches[self.shared_alias] if self.shared_alias else None
+
+    def get(self, key, default=None):
+        value = self.local.get(key, MISSING)
+        count('local', value)
+        if value is not MISSING or self.shared is None:
+            return default if value is MISSING else value
+        value = self.shared.get(key, MISSING)
+        count('shared', value)
+        if value is MISSING:
+            return default
+        self.local.set(key, value, settings.CACHE_LOCAL_TIMEOUT)
+        return value
+
+    def get_many(self, keys):
+        values = self.local.get_many(keys)
+        count_many('local', keys, values)
+        missing = [key for key in keys if key not in values]
+        if missing and self.shared is not None:
+            found = self.shared.get_many(missing)
+            count_many('shared', missing, found)
+            self.local.set_many(found, settings.CACHE_LOCAL_TIMEOUT)
+            values.update(found)
+        return values
+
+    def set(self, key, value, timeout=None):
+        if self.shared is not None:
+            self.shared.set(key, value, timeout)
+        self.local.set(key, value, local_timeout(timeout))
+
+    def set_many(self, mapping, timeout=None):
+        if self.shared is not None:
+            self.shared.set_many(mapping, timeout)
+        self.local.set_many(mapping, local_timeout(timeout))
+
+    def get_or_set(self, key, default, timeout=None):
+        value = self.get(key, MISSING)
+        if value is MISSING:
+            value = default()
+            self.set(key, value, timeout)
+        return value
+
+    def delete(self, key):
+        if self.shared is not None:
+            self.shared.delete(key)
+        self.local.delete(key)
+
+
+class SessionFileCache(FileBasedCache):
+    """File cache that never culls, for sessions.
+
+    FileBasedCache lists its whole directory on every ``set()`` and deletes
+    a random third of the files once ``MAX_ENTRIES`` is reached, which logs
+    out random users when sessions live only in the cache. Expired entries
+    are removed by the ``clear_sessions`` command instead.
+
+    Overrides the private ``_cull()`` of Django 5.2's FileBasedCache; check
+    it again when upgrading Django.
+    """
+
+    def _cull(self):
+        pass
+
+
+def local_timeout(timeout):
+    if timeout is None:
+        return settings.CACHE_LOCAL_TIMEOUT
+    return min(timeout, settings.CACHE_LOCAL_TIMEOUT)
+
+
+def count(tier, value):
+    result = 'miss' if value is MISSING else 'hit'
+    registry.inc('cache_requests_total', {'tier': tier, 'result': result})
+
+
+def count_many(tier, keys, found):
+    hits = sum(key in found for key in keys)
+    if hits:
+        registry.inc(
+            'cache_requests_total', {'tier': tier, 'result': 'hit'}, hits
+        )
+    if len(keys) > hits:
+        registry.inc(
+            'cache_requests_total',
+            {'tier': tier, 'result': 'miss'},
+            len(keys) - hits,
+        )
+
+
+cache = TieredCache()
+# rendered fragments are cheaper to re-render than to write to the shared tier
+fragment_cache = TieredCache(shared_alias=None)
@@ -2,4 +2,8 @@ from django.contrib import admin
 
 from task_manager.labels.models import Label
 
-admin.site.register(Label)
+
+@admin.register(Label)
+class LabelAdmin(admin.ModelAdmin):
+    list_display = ('name', 'created_at')
+    search_fields = ('name',)
@@ -0,0 +1,22 @@
+from django.db import migrations
+
+INDEXES = ('label_name_lower_idx',)
+
+
+def reindex(apps, schema_editor):
+    # built with SQLite's ASCII-only LOWER() before it was replaced
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for index in INDEXES:
+        schema_editor.execute(f'REINDEX {index}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labels', '0002_name_lower_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(reindex, migrations.RunPython.noop),
+    ]
@@ -1,9 +1,15 @@
 from django.db import models
+from django.db.models.functions import Lower
 
 
 class Label(models.Model):
     name = models.CharField(max_length=150, unique=True, blank=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(Lower('name'), name='label_name_lower_idx'),
+        ]
+
     def __str__(self):
         return self.name
@@ -1,5 +1,8 @@
+from unittest.mock import patch
+
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models.deletion import ProtectedError
+from django.db.models.deletion import Collector, ProtectedError
+from django.contrib.messages import get_messages
 from django.test import TestCase, Client
 from django.urls import reverse_lazy
 
@@ -106,6 +109,22 @@ class LabelsTest(TestCase):
         with self.assertRaises(ObjectDoesNotExist):
             Label.objects.get(id=self.label1.id)
 
+    def test_label_update_and_delete_queries(self):
+        with self.assertNumQueries(3):
+            self.client.get(
+                reverse_lazy('update_label', args=[self.label1.id])
+            )
+        with self.assertNumQueries(3):
+            self.client.get(
+                reverse_lazy('delete_label', args=[self.label1.id])
+            )
+        with self.assertNumQueries(11):
+            response = self.client.post(
+                reverse_lazy('delete_label', args=[self.label1.id])
+            )
+
+        self.assertRedirects(response, reverse_lazy('labels'))
+
     def test_status_delete_linked(self):
         before_objs_len = len(Label.objects.all())
         self.client.post(
@@ -117,3 +136,25 @@ class LabelsTest(TestCase):
             expected_exception=ProtectedError,
             expected_message=texts.messages['protected_label']
         )
+
+    def test_labels_usage_count(self):
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse_lazy('labels'))
+
+        self.assertEqual(
+            [label.usage_count for label in response.context['labels']],
+            [0, 2, 2]
+        )
+
+    def test_label_delete_linked_without_collector(self):
+        with patch.object(Collector, 'collect') as collect:
+            response = self.client.post(
+                reverse_lazy('delete_label', args=[self.label2.id])
+            )
+
+        collect.assert_not_called()
+        self.assertRedirects(response, reverse_lazy('labels'))
+        self.assertEqual(
+            [str(message) for message in get_messages(response.wsgi_request)],
+            [texts.messages['protected_label']]
+        )
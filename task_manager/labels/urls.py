@@ -1,9 +1,16 @@
 from django.urls import path
 
+from task_manager.async_views import select_view
 from task_manager.labels import views
 
 urlpatterns = [
-    path('', views.LabelsListView.as_view(), name='labels'),
+    path(
+        '',
+        select_view(
+            views.LabelsListView, views.AsyncLabelsListView
+        ).as_view(),
+        name='labels'
+    ),
     path('create/', views.LabelCreateView.as_view(), name='create_label'),
     path(
         '<int:pk>/update/',
@@ -5,10 +5,14 @@ from django.views.generic import CreateView, ListView, UpdateView, DeleteView
 from task_manager import texts
 from task_manager.labels.forms import LabelForm
 from task_manager.labels.models import Label
-from task_manager.mixins import AuthCheckMixin, ProtectDeleteMixin
+from task_manager.async_views import AsyncListView
+from task_manager.mixins import (
+    AsyncAuthCheckMixin, AuthCheckMixin, ProtectDeleteMixin, ReplicaReadMixin,
+    UsageCountMixin,
+)
 
 
-class LabelsListView(AuthCheckMixin, ListView):
+class LabelsListMixin(ReplicaReadMixin, UsageCountMixin):
     template_name = 'labels/labels.html'
     model = Label
     context_object_name = 'labels'
@@ -19,6 +23,16 @@ class LabelsListView(AuthCheckMixin, ListView):
     }
 
 
+class LabelsListView(AuthCheckMixin, LabelsListMixin, ListView):
+    pass
+
+
+class AsyncLabelsListView(
+    AsyncAuthCheckMixin, LabelsListMixin, AsyncListView
+):
+    pass
+
+
 class LabelCreateView(AuthCheckMixin, SuccessMessageMixin, CreateView):
     template_name = 'form.html'
     model = Label
@@ -0,0 +1,151 @@
+import random
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection, connections, transaction
+from django.utils import timezone
+
+from task_manager.benchmarks import percentiles
+from task_manager.seed import PREFIX
+from task_manager.tasks.models import Task
+
+# SQLite options compared with the configured ones
+SQLITE_DEFAULTS = {
+    'init_command': 'PRAGMA journal_mode=DELETE;PRAGMA synchronous=FULL;'
+                    'PRAGMA mmap_size=0',
+    'transaction_mode': None,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Runs concurrent reads and read-then-write transactions against '
+        'the benchmark tasks and reports throughput, latency percentiles '
+        'and lock errors. On SQLite the configured pragmas are compared '
+        'with the SQLite defaults.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8)
+        parser.add_argument(
+            '--operations', type=int, default=2000,
+            help='Operations per run.',
+        )
+        parser.add_argument('--write-ratio', type=float, default=0.2)
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        ids = list(
+            Task.objects.filter(name__startswith=f'{PREFIX} task ')
+            .values_list('pk', flat=True)
+        )
+        if not ids:
+            raise CommandError('No benchmark tasks, run seed_bench first.')
+        self.stdout.write(
+            f'{"profile":<12}{"ops/s":>9}{"read p50":>10}{"read p99":>10}'
+            f'{"write p50":>11}{"write p99":>11}{"errors":>8}'
+        )
+        for profile, database_options in get_profiles():
+            with database_options:
+                mix = Mix(ids, options['operations'], options['write_ratio'],
+                          options['seed'])
+                self.report(profile, *mix.run(options['threads']))
+
+    def report(self, profile, reads, writes, errors, elapsed):
+        read_p50, _, read_p99 = percentiles(reads or [0])
+        write_p50, _, write_p99 = percentiles(writes or [0])
+        self.stdout.write(
+            f'{profile:<12}{(len(reads) + len(writes)) / elapsed:>9.1f}'
+            f'{read_p50:>10.1f}{read_p99:>10.1f}'
+            f'{write_p50:>11.1f}{write_p99:>11.1f}{errors:>8}'
+        )
+
+
+def get_profiles():
+    profiles = [('configured', DatabaseOptions())]
+    if connection.vendor == 'sqlite':
+        profiles.append(('sqlite', DatabaseOptions(SQLITE_DEFAULTS)))
+    return profiles
+
+
+class DatabaseOptions:
+    """Replaces the connection options of new connections while active."""
+
+    def __init__(self, options=None):
+        self.options = options
+
+    def __enter__(self):
+        settings_dict = connections.settings['default']
+        self.saved = settings_dict.get('OPTIONS', {})
+        if self.options is not None:
+            settings_dict['OPTIONS'] = {**self.saved, **self.options}
+        # journal mode switches need the database to themselves
+        connection.close()
+
+    def __exit__(self, *exc_info):
+        connections.settings['default']['OPTIONS'] = self.saved
+        connection.close()
+
+
+class Mix:
+
+    def __init__(self, ids, operations, write_ratio, seed):
+        self.ids = ids
+        self.remaining = operations
+        self.write_ratio = write_ratio
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.reads = []
+        self.writes = []
+        self.errors = 0
+
+    def run(self, threads):
+        started = time.perf_counter()
+        workers = [threading.Thread(target=self.worker) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return self.reads, self.writes, self.errors, \
+            time.perf_counter() - started
+
+    def take(self):
+        with self.lock:
+            if not self.remaining:
+                return None
+            self.remaining -= 1
+            is_write = self.random.random() < self.write_ratio
+            return is_write, self.random.choice(self.ids)
+
+    def worker(self):
+        try:
+            while operation := self.take():
+                self.measure(*operation)
+        finally:
+            connection.close()
+
+    def measure(self, is_write, pk):
+        started = time.perf_counter()
+        try:
+            write(pk) if is_write else read(pk)
+        except OperationalError:
+            with self.lock:
+                self.errors += 1
+            return
+        timing = (time.perf_counter() - started) * 1000
+        with self.lock:
+            (self.writes if is_write else self.reads).append(timing)
+
+
+def read(pk):
+    return list(
+        Task.objects.filter(pk__lte=pk).order_by('-pk')
+        .values('pk', 'name', 'status_id')[:20]
+    )
+
+
+def write(pk):
+    with transaction.atomic():
+        Task.objects.filter(pk=pk).values_list('name', flat=True).get()
+        Task.objects.filter(pk=pk).update(updated_at=timezone.now())
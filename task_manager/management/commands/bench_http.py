@@ -0,0 +1,124 @@
+import http.client
+import threading
+import time
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.urls import reverse
+
+from task_manager.benchmarks import benchmark_user, percentiles
+from task_manager.tasks.models import Task
+
+
+class Command(BaseCommand):
+    help = (
+        'Sends concurrent requests to a running server as the first '
+        'benchmark user and reports throughput and latency percentiles '
+        'per path.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://127.0.0.1:8000')
+        parser.add_argument('--concurrency', type=int, default=16)
+        parser.add_argument(
+            '--requests', type=int, default=500,
+            help='Requests per path.',
+        )
+        parser.add_argument('--username')
+        parser.add_argument('--paths', nargs='*', default=())
+
+    def handle(self, *args, **options):
+        user = benchmark_user(options['username'])
+        client = Client()
+        client.force_login(user)
+        cookie = '{}={}'.format(
+            settings.SESSION_COOKIE_NAME,
+            client.cookies[settings.SESSION_COOKIE_NAME].value,
+        )
+        self.stdout.write(
+            f'{"path":<34}{"req/s":>9}{"p50 ms":>9}{"p95 ms":>9}'
+            f'{"p99 ms":>9}{"errors":>8}'
+        )
+        for path in options['paths'] or default_paths(user):
+            load = Load(options['url'], path, cookie, options['requests'])
+            self.report(path, *load.run(options['concurrency']))
+
+    def report(self, path, timings, errors, elapsed):
+        p50, p95, p99 = percentiles(timings)
+        self.stdout.write(
+            f'{path[:33]:<34}{len(timings) / elapsed:>9.1f}{p50:>9.1f}'
+            f'{p95:>9.1f}{p99:>9.1f}{errors:>8}'
+        )
+
+
+def default_paths(user):
+    task = Task.objects.filter(author=user).first() or Task.objects.first()
+    paths = [
+        reverse('tasks'),
+        reverse('labels'),
+        reverse('statuses'),
+        reverse('users'),
+    ]
+    if task:
+        paths += [
+            f'{reverse("tasks")}?status={task.status_id}',
+            reverse('task_detail', args=[task.pk]),
+        ]
+    return paths
+
+
+class Load:
+
+    def __init__(self, url, path, cookie, requests):
+        parts = urlsplit(url)
+        self.host, self.port = parts.hostname, parts.port
+        self.path = path
+        self.cookie = cookie
+        self.remaining = requests
+        self.lock = threading.Lock()
+        self.timings = []
+        self.errors = 0
+
+    def run(self, concurrency):
+        started = time.perf_counter()
+        threads = [
+            threading.Thread(target=self.worker) for _ in range(concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return self.timings, self.errors, time.perf_counter() - started
+
+    def take(self):
+        with self.lock:
+            if not self.remaining:
+                return False
+            self.remaining -= 1
+            return True
+
+    def worker(self):
+        connection = http.client.HTTPConnection(
+            self.host, self.port, timeout=60
+        )
+        while self.take():
+            started = time.perf_counter()
+            failed = self.request(connection)
+            with self.lock:
+                self.timings.append((time.perf_counter() - started) * 1000)
+                self.errors += failed
+        connection.close()
+
+    def request(self, connection):
+        try:
+            connection.request(
+                'GET', self.path, headers={'Cookie': self.cookie}
+            )
+            response = connection.getresponse()
+            response.read()
+            return response.status != 200
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            return True
@@ -0,0 +1,90 @@
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.seed import PREFIX
+from task_manager.statuses.models import Status
+from task_manager.users.models import User
+
+PASSWORD = 'bench-sessions'
+
+
+class Command(BaseCommand):
+    help = (
+        'Runs a login, status CRUD and logout flow under every session '
+        'profile and reports the queries and session table queries per step.'
+    )
+
+    def handle(self, *args, **options):
+        user, _ = User.objects.get_or_create(
+            username=f'{PREFIX}_sessions',
+            defaults={'first_name': 'Bench', 'last_name': 'Sessions'},
+        )
+        user.set_password(PASSWORD)
+        user.save()
+        try:
+            results = {
+                profile: self.run_flow(user, engine, storage)
+                for profile, (engine, storage)
+                in settings.SESSION_PROFILES.items()
+            }
+        finally:
+            user.delete()
+        self.report(results)
+
+    def run_flow(self, user, engine, storage):
+        with override_settings(SESSION_ENGINE=engine, MESSAGE_STORAGE=storage):
+            client = Client(SERVER_NAME='localhost')
+            return [
+                (step, *count_queries(client, method, path, data))
+                for step, method, path, data in flow(client, user)
+            ]
+
+    def report(self, results):
+        profiles = list(results)
+        self.stdout.write(
+            f'{"step":<16}'
+            + ''.join(f'{profile + " q/s":>16}' for profile in profiles)
+        )
+        for row in zip(*results.values()):
+            self.stdout.write(f'{row[0][0]:<16}' + ''.join(
+                f'{f"{queries}/{session}":>16}'
+                for _, queries, session in row
+            ))
+        self.stdout.write(f'{"total":<16}' + ''.join(
+            f'{total(steps, 1)}/{total(steps, 2)}'.rjust(16)
+            for steps in results.values()
+        ))
+
+
+def flow(client, user):
+    name = f'{PREFIX} session status {uuid4().hex[:8]}'
+    yield 'login', 'post', reverse('login'), {
+        'username': user.username, 'password': PASSWORD,
+    }
+    yield 'list', 'get', reverse('statuses'), None
+    yield 'create form', 'get', reverse('create_status'), None
+    yield 'create', 'post', reverse('create_status'), {'name': name}
+    status = Status.objects.get(name=name)
+    yield 'list + message', 'get', reverse('statuses'), None
+    yield 'update', 'post', reverse('update_status', args=[status.pk]), {
+        'name': f'{name} changed',
+    }
+    yield 'delete', 'post', reverse('delete_status', args=[status.pk]), None
+    yield 'logout', 'post', reverse('logout'), None
+
+
+def count_queries(client, method, path, data):
+    with CaptureQueriesContext(connection) as queries:
+        getattr(client, method)(path, data)
+    session = sum('django_session' in query['sql'] for query in queries)
+    return len(queries), session
+
+
+def total(steps, column):
+    return sum(step[column] for step in steps)
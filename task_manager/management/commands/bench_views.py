@@ -0,0 +1,125 @@
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import get_resolver, reverse
+
+from task_manager.benchmarks import benchmark_user, percentiles
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+
+SKIPPED_PREFIXES = ('panel/',)
+# Whole-table exports are benchmarked with a filter instead.
+FILTERED_ONLY = ('tasks_export',)
+
+
+class Command(BaseCommand):
+    help = (
+        'Requests every URL of the project in-process and reports latency '
+        'percentiles, query count and peak memory per view.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=20)
+        parser.add_argument(
+            '--username',
+            help='User to log in as, defaults to the first benchmark user.',
+        )
+        parser.add_argument(
+            '--only', nargs='*', default=(),
+            help='URL names to benchmark.',
+        )
+        parser.add_argument('--exclude', nargs='*', default=())
+
+    def handle(self, *args, **options):
+        user = benchmark_user(options['username'])
+        client = Client(SERVER_NAME='localhost', HTTP_REFERER='/')
+        client.force_login(user)
+        self.stdout.write(
+            f'{"view":<16}{"path":<34}{"status":>7}{"p50 ms":>9}'
+            f'{"p95 ms":>9}{"p99 ms":>9}{"queries":>9}{"peak KB":>10}'
+        )
+        for name, path in self.get_cases(user):
+            if options['only'] and name not in options['only'] \
+                    or name in options['exclude']:
+                continue
+            self.report(name, path, *self.measure(
+                client, path, options['requests']
+            ))
+
+    def get_cases(self, user):
+        task = Task.objects.filter(author=user).first() or Task.objects.first()
+        cases = []
+        for name, pattern, view_class in iter_patterns(get_resolver()):
+            if name in FILTERED_ONLY:
+                continue
+            kwargs = {}
+            for key in pattern.converters:
+                kwargs[key] = self.get_argument(key, view_class, user, task)
+            cases.append((name, reverse(name, kwargs=kwargs)))
+        if task:
+            tasks = reverse('tasks')
+            cases += [
+                ('tasks', f'{tasks}?status={task.status_id}'),
+                ('tasks', f'{tasks}?executor={task.executor_id or ""}'),
+                ('tasks', f'{tasks}?personal=on'),
+                ('tasks_export', f'{reverse("tasks_export")}'
+                                 f'?status={task.status_id}'
+                                 f'&executor={task.executor_id or ""}'),
+            ]
+        return cases
+
+    @staticmethod
+    def get_argument(key, view_class, user, task):
+        if key == 'language':
+            return 'en'
+        model = getattr(view_class, 'model', None)
+        if model is User:
+            return user.pk
+        if model is Task and task:
+            return task.pk
+        obj = model.objects.order_by('pk').first() if model else None
+        return obj.pk if obj else 0
+
+    def measure(self, client, path, requests):
+        consume(client.get(path))
+        timings = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            response = client.get(path)
+            consume(response)
+            timings.append((time.perf_counter() - started) * 1000)
+        with CaptureQueriesContext(connection) as queries:
+            tracemalloc.start()
+            consume(client.get(path))
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        return response.status_code, timings, len(queries), peak
+
+    def report(self, name, path, status, timings, queries, peak):
+        p50, p95, p99 = percentiles(timings)
+        self.stdout.write(
+            f'{name:<16}{path[:33]:<34}{status:>7}{p50:>9.1f}{p95:>9.1f}'
+            f'{p99:>9.1f}{queries:>9}{peak / 1024:>10.0f}'
+        )
+
+
+def iter_patterns(resolver, prefix=''):
+    for pattern in resolver.url_patterns:
+        route = prefix + str(pattern.pattern)
+        if route.startswith(SKIPPED_PREFIXES):
+            continue
+        if hasattr(pattern, 'url_patterns'):
+            yield from iter_patterns(pattern, route)
+        elif pattern.name:
+            view_class = getattr(pattern.callback, 'view_class', None)
+            yield pattern.name, pattern.pattern, view_class
+
+
+def consume(response):
+    if response.streaming:
+        for _ in response.streaming_content:
+            pass
@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        'Deletes expired sessions from the database and from the session '
+        'cache. Run it periodically, e.g. daily from cron.'
+    )
+
+    def handle(self, *args, **options):
+        call_command('clearsessions')
+        removed = clear_expired_files(caches[settings.SESSION_CACHE_ALIAS])
+        self.stdout.write(f'Removed {removed} expired cached sessions.')
+
+
+def clear_expired_files(cache):
+    # the file cache drops expired entries only when they are read again;
+    # _list_cache_files() and _is_expired() are private to Django 5.2's
+    # FileBasedCache, check them again when upgrading Django
+    if not isinstance(cache, FileBasedCache):
+        return 0
+    removed = 0
+    for path in cache._list_cache_files():
+        try:
+            with open(path, 'rb') as file:
+                removed += cache._is_expired(file)
+        except FileNotFoundError:
+            pass
+    return removed
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+
+from task_manager.seed import clear_dataset, generate_dataset
+
+
+class Command(BaseCommand):
+    help = 'Generates a reproducible benchmark dataset with bulk inserts.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100)
+        parser.add_argument('--statuses', type=int, default=5)
+        parser.add_argument('--labels', type=int, default=20)
+        parser.add_argument('--tasks', type=int, default=10000)
+        parser.add_argument('--labels-per-task', type=int, default=2)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--batch-size', type=int, default=2000)
+        parser.add_argument(
+            '--flush', action='store_true',
+            help='Delete previously generated benchmark data first.',
+        )
+
+    def handle(self, *args, **options):
+        if options['flush']:
+            clear_dataset()
+        created = generate_dataset(
+            users=options['users'],
+            statuses=options['statuses'],
+            labels=options['labels'],
+            tasks=options['tasks'],
+            labels_per_task=options['labels_per_task'],
+            seed=options['seed'],
+            batch_size=options['batch_size'],
+            progress=self.progress if options['verbosity'] > 1 else None,
+        )
+        self.stdout.write(f'Generated {created} tasks.')
+
+    def progress(self, created):
+        self.stdout.write(f'{created} tasks')
@@ -0,0 +1,172 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from uuid import uuid4
+
+from django.conf import settings
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METHODS = {'GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'}
+
+
+def label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+class MetricsRegistry:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pid = self.file_name = None
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.counters = defaultdict(float)
+            self.histograms = {}
+            self.last_flush = 0.0
+
+    def inc(self, name, labels, value=1):
+        with self.lock:
+            self.counters[name, label_key(labels)] += value
+
+    def observe(self, name, labels, value):
+        key = name, label_key(labels)
+        with self.lock:
+            histogram = self.histograms.setdefault(
+                key, [0] * (len(BUCKETS) + 1) + [0.0]
+            )
+            position = next(
+                (i for i, bound in enumerate(BUCKETS) if value <= bound),
+                len(BUCKETS),
+            )
+            histogram[position] += 1
+            histogram[-1] += value
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'counters': [
+                    [name, labels, value]
+                    for (name, labels), value in self.counters.items()
+                ],
+                'histograms': [
+                    [name, labels, values]
+                    for (name, labels), values in self.histograms.items()
+                ],
+            }
+
+    def flush(self, force=False):
+        directory = settings.METRICS_DIR
+        now = time.monotonic()
+        if not directory or (
+            not force and now - self.last_flush < settings.METRICS_FLUSH_SECONDS
+        ):
+            return
+        self.last_flush = now
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        handle, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(handle, 'w') as file:
+            json.dump(self.snapshot(), file)
+        os.replace(temporary, Path(directory) / self.get_file_name())
+
+    def get_file_name(self):
+        # unique per process, a reused pid must not overwrite the totals
+        # of the process that had it before
+        pid = os.getpid()
+        if self.pid != pid:
+            self.pid, self.file_name = pid, f'{pid}-{uuid4().hex}.json'
+        return self.file_name
+
+    def collect(self):
+        directory = settings.METRICS_DIR
+        if not directory:
+            return [self.snapshot()]
+        self.flush(force=True)
+        snapshots = []
+        for path in Path(directory).glob('*.json'):
+            try:
+                snapshots.append(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                continue
+        return snapshots
+
+    def render(self):
+        counters, histograms = merge(self.collect())
+        lines = []
+        for name in sorted({name for name, _ in counters}):
+            lines.append(f'# TYPE {name} counter')
+            lines += [
+                f'{name}{format_labels(labels)} {format_value(value)}'
+                for (metric, labels), value in sorted(counters.items())
+                if metric == name
+            ]
+        for name in sorted({name for name, _ in histograms}):
+            lines.append(f'# TYPE {name} histogram')
+            for (metric, labels), values in sorted(histograms.items()):
+                if metric == name:
+                    lines += render_histogram(name, labels, values)
+        return '\n'.join(lines) + '\n'
+
+
+def merge(snapshots):
+    counters = defaultdict(float)
+    histograms = {}
+    for snapshot in snapshots:
+        for name, labels, value in snapshot['counters']:
+            counters[name, tuple(map(tuple, labels))] += value
+        for name, labels, values in snapshot['histograms']:
+            key = name, tuple(map(tuple, labels))
+            merged = histograms.setdefault(key, [0] * len(values))
+            histograms[key] = [a + b for a, b in zip(merged, values)]
+    return counters, histograms
+
+
+def render_histogram(name, labels, values):
+    lines = []
+    cumulative = 0
+    for bound, count in zip(BUCKETS + ('+Inf',), values[:-1]):
+        cumulative += count
+        bucket_labels = labels + (('le', str(bound)),)
+        lines.append(
+            f'{name}_bucket{format_labels(bucket_labels)} {cumulative}'
+        )
+    lines.append(
+        f'{name}_sum{format_labels(labels)} {format_value(values[-1])}'
+    )
+    lines.append(f'{name}_count{format_labels(labels)} {cumulative}')
+    return lines
+
+
+def format_labels(labels):
+    if not labels:
+        return ''
+    return '{%s}' % ','.join(
+        '%s="%s"' % (key, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+        for key, value in labels
+    )
+
+
+def format_value(value):
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+registry = MetricsRegistry()
+
+
+def record_request(request, response, duration):
+    match = request.resolver_match
+    route = match.url_name if match and match.url_name else 'unmatched'
+    method = request.method if request.method in METHODS else 'OTHER'
+    labels = {'route': route, 'method': method}
+    registry.inc('http_requests_total', labels)
+    if response.status_code >= 500:
+        registry.inc('http_request_errors_total', labels)
+    registry.observe(
+        'http_request_duration_seconds', {'route': route}, duration
+    )
+    registry.flush()
@@ -0,0 +1,210 @@
+import json
+import logging
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import (
+    iscoroutinefunction, markcoroutinefunction, sync_to_async,
+)
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from task_manager.metrics import record_request
+from task_manager.routers import start_request
+
+logger = logging.getLogger('task_manager.performance')
+
+
+class QueryRecorder:
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - started
+
+
+class RequestTimer:
+
+    def __init__(self):
+        self.queries = QueryRecorder()
+        self.started = time.perf_counter()
+        self.view_started = None
+        self.view_finished = None
+        self.finished = None
+
+    def finish(self):
+        self.finished = time.perf_counter()
+
+    def metrics(self):
+        total = self.finished - self.started
+        view_started = self.view_started or self.started
+        view_finished = self.view_finished or self.finished
+        return {
+            'db': self.queries.duration * 1000,
+            'view': (view_finished - view_started) * 1000,
+            'render': (self.finished - view_finished) * 1000,
+            'total': total * 1000,
+        }
+
+
+class ServerTimingMiddleware:
+
+    def __init__(self, get_response):
+        if not settings.SERVER_TIMING:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.threshold = settings.SLOW_REQUEST_THRESHOLD_MS
+
+    def __call__(self, request):
+        timer = request.timer = RequestTimer()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(
+                    connections[alias].execute_wrapper(timer.queries)
+                )
+            response = self.get_response(request)
+        timer.finish()
+        metrics = timer.metrics()
+        response['Server-Timing'] = server_timing(metrics, timer.queries)
+        if metrics['total'] >= self.threshold:
+            log_slow_request(request, response, metrics, timer.queries)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.timer.view_started = time.perf_counter()
+
+    def process_template_response(self, request, response):
+        request.timer.view_finished = time.perf_counter()
+        return response
+
+
+class MetricsMiddleware:
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = time.perf_counter()
+        response = self.get_response(request)
+        record_request(request, response, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        record_request(request, response, time.perf_counter() - started)
+        return response
+
+
+class ReplicaMiddleware:
+    """Routes reads of read-only views to the replica database.
+
+    After a request writes, the client reads from the primary for
+    REPLICA_PIN_SECONDS so it sees its own changes.
+    """
+
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.REPLICA_DATABASE_URL:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        routing = self.start(request)
+        return self.pin(routing, self.get_response(request))
+
+    async def __acall__(self, request):
+        routing = self.start(request)
+        return self.pin(routing, await self.get_response(request))
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, 'view_class', None)
+        if request.method in ('GET', 'HEAD') \
+                and getattr(view_class, 'read_replica', False):
+            request.routing['replica'] = True
+
+    def start(self, request):
+        request.routing = start_request(
+            settings.REPLICA_PIN_COOKIE in request.COOKIES
+        )
+        return request.routing
+
+    @staticmethod
+    def pin(routing, response):
+        if routing['written']:
+            response.set_cookie(
+                settings.REPLICA_PIN_COOKIE, '1',
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True, samesite='Lax',
+            )
+        return response
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """WhiteNoise that keeps async requests on the event loop."""
+
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(
+                request.path_info
+            )
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
+
+
+def server_timing(metrics, queries):
+    return ', '.join(
+        f'{name};dur={duration:.1f}' + (
+            f';desc="{queries.count} queries"' if name == 'db' else ''
+        )
+        for name, duration in metrics.items()
+    )
+
+
+def log_slow_request(request, response, metrics, queries):
+    match = request.resolver_match
+    logger.warning(json.dumps({
+        'event': 'slow_request',
+        'method': request.method,
+        'path': request.path,
+        'view': match.view_name if match else None,
+        'status': response.status_code,
+        'queries': queries.count,
+        **{f'{name}_ms': round(value, 1) for name, value in metrics.items()},
+    }))
@@ -1,8 +1,24 @@
+import hashlib
+from collections import defaultdict
+from functools import reduce
+from operator import add, or_
+from secrets import compare_digest
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib import messages
-from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
-from django.db.models import ProtectedError
+from django.contrib.auth.mixins import (
+    AccessMixin, LoginRequiredMixin, UserPassesTestMixin,
+)
+from django.db.models import (
+    PROTECT, Func, IntegerField, OuterRef, ProtectedError, Q, Subquery,
+)
+from django.http import JsonResponse
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from django.utils.translation import get_language
 
 from task_manager import texts
 
@@ -16,7 +32,46 @@ class AuthCheckMixin(LoginRequiredMixin):
         return super().dispatch(request, *args, **kwargs)
 
 
-class PermissionCheckMixin(UserPassesTestMixin):
+class ApiAuthMixin(AccessMixin):
+    """Signed-in users or ``Authorization: Bearer <API_TOKEN>``.
+
+    Other requests get a JSON 401 instead of the login redirect.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        if not self.has_access(request):
+            return self.handle_no_permission()
+        return super().dispatch(request, *args, **kwargs)
+
+    @staticmethod
+    def has_access(request):
+        token = settings.API_TOKEN
+        header = request.headers.get('Authorization', '')
+        if token and compare_digest(header, f'Bearer {token}'):
+            return True
+        return request.user.is_authenticated
+
+    def handle_no_permission(self):
+        return JsonResponse(
+            {'error': 'Authentication required'}, status=401,
+            headers={'WWW-Authenticate': 'Bearer'},
+        )
+
+
+class CachedObjectMixin:
+    """Loads the object of a single object view once per request."""
+
+    cached_object = None
+
+    def get_object(self, queryset=None):
+        if queryset is not None:
+            return super().get_object(queryset)
+        if self.cached_object is None:
+            self.cached_object = super().get_object()
+        return self.cached_object
+
+
+class PermissionCheckMixin(CachedObjectMixin, UserPassesTestMixin):
     permission_message = None
     permission_url = None
 
@@ -31,17 +86,150 @@ class PermissionCheckMixin(UserPassesTestMixin):
 class AuthorCheckMixin(PermissionCheckMixin):
 
     def test_func(self):
-        return self.get_object().author == self.request.user
+        return self.get_object().author_id == self.request.user.pk
+
+
+def protecting_relations(model):
+    relations = defaultdict(list)
+    for relation in model._meta.related_objects:
+        if relation.on_delete is PROTECT:
+            relations[relation.related_model].append(relation.field.name)
+    return relations.items()
+
+
+def referencing(model, fields, value):
+    return model._default_manager.filter(
+        reduce(or_, (Q(**{field: value}) for field in fields))
+    )
+
+
+def usage_count(model):
+    return reduce(add, (
+        Subquery(
+            referencing(related, fields, OuterRef('pk')).order_by().annotate(
+                count=Func('pk', function='COUNT')
+            ).values('count'),
+            output_field=IntegerField(),
+        )
+        for related, fields in protecting_relations(model)
+    ))
+
+
+def is_protected(obj):
+    return any(
+        referencing(related, fields, obj.pk).exists()
+        for related, fields in protecting_relations(type(obj))
+    )
+
+
+class ReplicaReadMixin:
+    """Lets GET requests of a view read from the replica database."""
+
+    read_replica = True
 
 
-class ProtectDeleteMixin:
+class UsageCountMixin:
+
+    def get_queryset(self):
+        return super().get_queryset().annotate(
+            usage_count=usage_count(self.model)
+        )
+
+
+class ProtectDeleteMixin(CachedObjectMixin):
 
     protected_message = None
     protected_url = None
 
     def post(self, request, *args, **kwargs):
+        if is_protected(self.get_object()):
+            return self.handle_protected()
         try:
             return super().post(request, *args, **kwargs)
         except ProtectedError:
-            messages.error(request, self.protected_message)
-            return redirect(self.protected_url)
+            return self.handle_protected()
+
+    def handle_protected(self):
+        messages.error(self.request, self.protected_message)
+        return redirect(self.protected_url)
+
+
+class AsyncAuthCheckMixin:
+
+    async def dispatch(self, request, *args, **kwargs):
+        request.user = await request.auser()
+        if not request.user.is_authenticated:
+            messages.error(request, texts.messages['no_auth'])
+            return redirect(reverse_lazy('login'))
+        return await super().dispatch(request, *args, **kwargs)
+
+
+def validator_etag(view, last_modified, state):
+    return quote_etag(hashlib.md5(repr((
+        type(view).__name__,
+        view.request.user.pk,
+        get_language(),
+        view.request.session.session_key,
+        last_modified,
+        state,
+    )).encode()).hexdigest())
+
+
+def set_validators(response, etag, last_modified):
+    response.headers['ETag'] = etag
+    if last_modified:
+        response.headers['Last-Modified'] = http_date(last_modified)
+    return response
+
+
+def has_messages(request):
+    return bool(messages.get_messages(request))
+
+
+class ConditionalGetMixin:
+
+    def get(self, request, *args, **kwargs):
+        validators = None if has_messages(request) else (
+            self.get_validators()
+        )
+        if validators is None:
+            return super().get(request, *args, **kwargs)
+        last_modified, state = validators
+        etag = validator_etag(self, last_modified, state)
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        response = get_conditional_response(
+            request, etag=etag, last_modified=timestamp
+        )
+        if response is None:
+            response = set_validators(
+                super().get(request, *args, **kwargs), etag, timestamp
+            )
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def get_validators(self):
+        return None
+
+
+class AsyncConditionalGetMixin:
+
+    async def get(self, request, *args, **kwargs):
+        pending = await sync_to_async(has_messages)(request)
+        validators = None if pending else await self.aget_validators()
+        if validators is None:
+            return await super().get(request, *args, **kwargs)
+        last_modified, state = validators
+        etag = validator_etag(self, last_modified, state)
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        response = get_conditional_response(
+            request, etag=etag, last_modified=timestamp
+        )
+        if response is None:
+            response = set_validators(
+                await super().get(request, *args, **kwargs), etag, timestamp
+            )
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    async def aget_validators(self):
+        return None
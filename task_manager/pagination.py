@@ -0,0 +1,256 @@
+import base64
+import datetime
+import json
+
+from django.contrib.admin.views.main import PAGE_VAR
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import Http404
+from django.utils.functional import cached_property
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """Keeps the microseconds DjangoJSONEncoder drops from datetimes."""
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def encode_cursor(direction, values):
+    data = json.dumps([direction, *values], cls=CursorEncoder)
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise InvalidCursor(cursor)
+    if not isinstance(data, list) or len(data) < 2:
+        raise InvalidCursor(cursor)
+    return data[0], data[1:]
+
+
+class CappedCount(int):
+    """Object count that stopped at the cap, shown as "10000+"."""
+
+    def __str__(self):
+        return f'{int(self)}+'
+
+
+class CappedCountPaginator(Paginator):
+    """Paginator that counts at most ``max_count`` objects past the page.
+
+    The cap moves with ``page_number``, so pages past it stay reachable.
+    """
+
+    max_count = 10000
+
+    def __init__(self, *args, page_number=1, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.page_number = page_number
+
+    @cached_property
+    def count(self):
+        cap = (self.page_number - 1) * self.per_page + self.max_count
+        count = self.object_list.order_by()[:cap + 1].count()
+        return CappedCount(cap) if count > cap else count
+
+
+class CappedCountAdminMixin:
+    """Change list that never counts the whole table."""
+
+    paginator = CappedCountPaginator
+    show_full_result_count = False
+
+    def get_paginator(self, request, queryset, per_page, orphans=0,
+                      allow_empty_first_page=True):
+        try:
+            page_number = max(int(request.GET.get(PAGE_VAR, 1)), 1)
+        except ValueError:
+            page_number = 1
+        return self.paginator(
+            queryset, per_page, orphans, allow_empty_first_page,
+            page_number=page_number,
+        )
+
+
+class KeysetPage:
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+
+    NEXT = 'n'
+    PREVIOUS = 'p'
+
+    def __init__(self, queryset, per_page, ordering=('created_at', 'id')):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+
+    def get_page(self, cursor=None):
+        direction, key = self.parse_cursor(cursor)
+        rows = list(self.get_queryset(direction, key))
+        return self.build_page(rows, direction, key)
+
+    async def aget_page(self, cursor=None):
+        direction, key = self.parse_cursor(cursor)
+        rows = [row async for row in self.get_queryset(direction, key)]
+        return self.build_page(rows, direction, key)
+
+    def get_queryset(self, direction, key):
+        queryset = self.queryset
+        ordering = self.ordering
+        if key is not None:
+            queryset = queryset.filter(
+                self.seek(key, backwards=direction == self.PREVIOUS)
+            )
+        if direction == self.PREVIOUS:
+            ordering = self.reverse(ordering)
+        return queryset.order_by(*ordering)[:self.per_page + 1]
+
+    def build_page(self, rows, direction, key):
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if direction == self.PREVIOUS:
+            rows.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, key is not None
+        return KeysetPage(
+            rows,
+            next_cursor=self.cursor_for(self.NEXT, rows[-1])
+            if has_next and rows else None,
+            previous_cursor=self.cursor_for(self.PREVIOUS, rows[0])
+            if has_previous and rows else None,
+        )
+
+    def parse_cursor(self, cursor):
+        if not cursor:
+            return self.NEXT, None
+        direction, values = decode_cursor(cursor)
+        if direction not in (self.NEXT, self.PREVIOUS) \
+                or len(values) != len(self.ordering):
+            raise InvalidCursor(cursor)
+        return direction, [
+            self.to_python(name, value)
+            for name, value in zip(self.field_names, values)
+        ]
+
+    def to_python(self, name, value):
+        try:
+            field = self.queryset.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return value
+        try:
+            return field.to_python(value)
+        except ValidationError:
+            raise InvalidCursor(value)
+
+    def cursor_for(self, direction, row):
+        return encode_cursor(direction, [
+            row[name] if isinstance(row, dict) else getattr(row, name)
+            for name in self.field_names
+        ])
+
+    @property
+    def field_names(self):
+        return [name.lstrip('-') for name in self.ordering]
+
+    def seek(self, key, backwards=False):
+        condition = Q()
+        for position, name in enumerate(self.ordering):
+            lookup = self.lookup(name, 'lt', 'gt', backwards)
+            equal = {
+                field: value for field, value
+                in zip(self.field_names[:position], key[:position])
+            }
+            condition |= Q(**equal, **{lookup: key[position]})
+        # The redundant bound on the leading column lets the planner turn
+        # the seek into an index range scan.
+        bound = self.lookup(self.ordering[0], 'lte', 'gte', backwards)
+        return Q(**{bound: key[0]}) & condition
+
+    @staticmethod
+    def lookup(name, descending_lookup, ascending_lookup, backwards):
+        descending = name.startswith('-') != backwards
+        return '%s__%s' % (
+            name.lstrip('-'),
+            descending_lookup if descending else ascending_lookup,
+        )
+
+    @staticmethod
+    def reverse(ordering):
+        return tuple(
+            name[1:] if name.startswith('-') else '-' + name
+            for name in ordering
+        )
+
+
+class KeysetPaginationMixin:
+    paginate_by = 50
+    cursor_ordering = ('created_at', 'id')
+    cursor_kwarg = 'cursor'
+
+    def get_cursor_ordering(self):
+        return self.cursor_ordering
+
+    def get_keyset_paginator(self, queryset, page_size):
+        return KeysetPaginator(
+            queryset, page_size, ordering=self.get_cursor_ordering()
+        )
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = self.get_keyset_paginator(queryset, page_size)
+        try:
+            page = paginator.get_page(
+                self.request.GET.get(self.cursor_kwarg)
+            )
+        except InvalidCursor:
+            raise Http404('Invalid cursor')
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    async def apaginate_queryset(self, queryset, page_size):
+        paginator = self.get_keyset_paginator(queryset, page_size)
+        try:
+            page = await paginator.aget_page(
+                self.request.GET.get(self.cursor_kwarg)
+            )
+        except InvalidCursor:
+            raise Http404('Invalid cursor')
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_context_data(self, **kwargs):
+        query = self.request.GET.copy()
+        query.pop(self.cursor_kwarg, None)
+        kwargs.setdefault('cursor_query', query.urlencode())
+        return super().get_context_data(**kwargs)
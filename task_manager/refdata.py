@@ -0,0 +1,152 @@
+from contextvars import ContextVar
+from uuid import uuid4
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from task_manager.cache import cache
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+
+# small tables only: users are looked up by primary key instead
+SNAPSHOT_FIELDS = {
+    Status: ('name',),
+    Label: ('name',),
+}
+
+# versions are read once per request, see start_request()
+request_versions = ContextVar('request_versions', default=None)
+
+
+def snapshot_fields(model):
+    return [
+        field.attname for field in model._meta.concrete_fields
+        if field.primary_key or field.attname in SNAPSHOT_FIELDS[model]
+    ]
+
+
+def version_key(model):
+    return f'refdata:version:{model._meta.label_lower}'
+
+
+def snapshot_key(model, version):
+    return f'refdata:{model._meta.label_lower}:{version}'
+
+
+def current_version(model):
+    versions = request_versions.get()
+    if versions is None:
+        return load_versions([model])[model]
+    if model not in versions:
+        versions.update(load_versions(SNAPSHOT_FIELDS))
+    return versions[model]
+
+
+def load_versions(models):
+    keys = {version_key(model): model for model in models}
+    found = cache.shared.get_many(keys)
+    missing = {key: uuid4().hex for key in keys if key not in found}
+    for key, version in missing.items():
+        if not cache.shared.add(key, version, None):
+            found[key] = cache.shared.get(key)
+        else:
+            found[key] = version
+    return {keys[key]: version for key, version in found.items()}
+
+
+def bump_version(model):
+    version = uuid4().hex
+    cache.shared.set(version_key(model), version, None)
+    versions = request_versions.get()
+    if versions is not None:
+        versions[model] = version
+
+
+def start_request(**kwargs):
+    request_versions.set({})
+
+
+def finish_request(**kwargs):
+    request_versions.set(None)
+
+
+def snapshot(model):
+    # snapshots are shared by every worker under the current version, so
+    # they are built from the primary even while the request reads the
+    # replica, which may not have the change that bumped the version yet
+    return cache.get_or_set(
+        snapshot_key(model, current_version(model)),
+        lambda: {
+            row[0]: row for row in model._default_manager
+            .using(DEFAULT_DB_ALIAS).order_by()
+            .values_list(*snapshot_fields(model))
+        },
+    )
+
+
+def is_snapshotted(queryset):
+    return (
+        queryset.model in SNAPSHOT_FIELDS
+        and not queryset.query.where
+        and queryset.query.deferred_loading == (frozenset(), True)
+    )
+
+
+def lookup(queryset, values):
+    """Return the objects of ``queryset`` with the given primary keys."""
+    if not is_snapshotted(queryset):
+        return list(queryset.filter(pk__in=values))
+    model = queryset.model
+    field_names = snapshot_fields(model)
+    rows = snapshot(model)
+    objects = {}
+    for value in values:
+        try:
+            pk = model._meta.pk.to_python(value)
+        except ValidationError:
+            continue
+        if pk in rows:
+            objects[pk] = model.from_db(
+                queryset.db, field_names, rows[pk]
+            )
+    return list(objects.values())
+
+
+def invalidate(sender, update_fields=None, **kwargs):
+    if update_fields and not set(SNAPSHOT_FIELDS[sender]) & set(update_fields):
+        return
+    bump_version(sender)
+    transaction.on_commit(lambda: bump_version(sender))
+
+
+class ReferenceChoiceField(forms.ModelChoiceField):
+
+    def to_python(self, value):
+        if value in self.empty_values or not is_snapshotted(self.queryset):
+            return super().to_python(value)
+        objects = lookup(self.queryset, [getattr(value, 'pk', value)])
+        if not objects:
+            raise ValidationError(
+                self.error_messages['invalid_choice'],
+                code='invalid_choice',
+                params={'value': value},
+            )
+        return objects[0]
+
+
+class ReferenceMultipleChoiceField(forms.ModelMultipleChoiceField):
+
+    def _check_values(self, value):
+        if not is_snapshotted(self.queryset):
+            return super()._check_values(value)
+        objects = lookup(self.queryset, value)
+        found = {str(obj.pk) for obj in objects}
+        for item in value:
+            if str(item) not in found:
+                raise ValidationError(
+                    self.error_messages['invalid_choice'],
+                    code='invalid_choice',
+                    params={'value': item},
+                )
+        return objects
@@ -0,0 +1,55 @@
+from contextvars import ContextVar
+
+from django.db import DEFAULT_DB_ALIAS
+
+REPLICA = 'replica'
+# sessions are read right after they are written, the cache table is shared
+# state of the workers and is not worth replicating
+PRIMARY_ONLY_APPS = ('sessions', 'django_cache')
+
+# routing state of the current request, see ReplicaMiddleware
+request_routing = ContextVar('request_routing', default=None)
+
+
+def start_request(pinned=False):
+    request_routing.set({'replica': False, 'pinned': pinned, 'written': False})
+    return request_routing.get()
+
+
+def finish_request(**kwargs):
+    request_routing.set(None)
+
+
+def reads_replica(model):
+    routing = request_routing.get()
+    return (
+        routing is not None
+        and routing['replica']
+        and not routing['pinned']
+        and not routing['written']
+        and model._meta.app_label not in PRIMARY_ONLY_APPS
+    )
+
+
+class ReplicaRouter:
+    """Sends reads of read-only views to the replica.
+
+    Once a request writes, the rest of it reads from the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        return REPLICA if reads_replica(model) else DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        routing = request_routing.get()
+        if routing is not None \
+                and model._meta.app_label not in PRIMARY_ONLY_APPS:
+            routing['written'] = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, **hints):
+        # the replica gets its schema from the primary
+        return db != REPLICA
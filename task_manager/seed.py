@@ -0,0 +1,106 @@
+import random
+
+from django.db import transaction
+
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task, TaskLabelLinks
+from task_manager.users.models import User
+
+PREFIX = 'bench'
+
+
+def generate_dataset(
+    users=100,
+    statuses=5,
+    labels=20,
+    tasks=10000,
+    labels_per_task=2,
+    seed=0,
+    batch_size=2000,
+    progress=None,
+):
+    rng = random.Random(seed)
+    with transaction.atomic():
+        user_ids = _create_users(users, batch_size)
+        status_ids = _create_named(Status, statuses, 'status', batch_size)
+        label_ids = _create_named(Label, labels, 'label', batch_size)
+    start = Task.objects.filter(name__startswith=f'{PREFIX} task ').count()
+    created = 0
+    while created < tasks:
+        size = min(batch_size, tasks - created)
+        with transaction.atomic():
+            _create_tasks(
+                rng, start + created, size, user_ids, status_ids, label_ids,
+                labels_per_task, batch_size,
+            )
+        created += size
+        if progress:
+            progress(created)
+    return created
+
+
+def clear_dataset():
+    with transaction.atomic():
+        tasks = Task.objects.filter(name__startswith=f'{PREFIX} task ')
+        TaskLabelLinks.objects.filter(task__in=tasks).delete()
+        tasks.delete()
+        Label.objects.filter(name__startswith=f'{PREFIX} label ').delete()
+        Status.objects.filter(name__startswith=f'{PREFIX} status ').delete()
+        User.objects.filter(username__startswith=f'{PREFIX}_user_').delete()
+
+
+def _create_users(count, batch_size):
+    return _ensure(
+        User, 'username', f'{PREFIX}_user_', count,
+        lambda name, number: User(
+            username=name,
+            first_name=f'Bench{number}',
+            last_name=f'User{number}',
+            password='!',
+        ),
+        batch_size,
+    )
+
+
+def _create_named(model, count, kind, batch_size):
+    return _ensure(
+        model, 'name', f'{PREFIX} {kind} ', count,
+        lambda name, number: model(name=name),
+        batch_size,
+    )
+
+
+def _ensure(model, field, prefix, count, build, batch_size):
+    ids = dict(
+        model.objects.filter(
+            **{f'{field}__startswith': prefix}
+        ).values_list(field, 'pk')
+    )
+    names = [f'{prefix}{number}' for number in range(count)]
+    missing = model.objects.bulk_create([
+        build(name, number)
+        for number, name in enumerate(names) if name not in ids
+    ], batch_size=batch_size)
+    ids.update((getattr(obj, field), obj.pk) for obj in missing)
+    return [ids[name] for name in names]
+
+
+def _create_tasks(rng, start, size, user_ids, status_ids, label_ids,
+                  labels_per_task, batch_size):
+    tasks = Task.objects.bulk_create([
+        Task(
+            name=f'{PREFIX} task {start + number}',
+            description=f'Generated task {start + number}',
+            status_id=rng.choice(status_ids),
+            author_id=rng.choice(user_ids),
+            executor_id=rng.choice(user_ids) if rng.random() < 0.9 else None,
+        )
+        for number in range(size)
+    ], batch_size=batch_size)
+    per_task = min(labels_per_task, len(label_ids))
+    TaskLabelLinks.objects.bulk_create([
+        TaskLabelLinks(task_id=task.pk, label_id=label_id)
+        for task in tasks
+        for label_id in rng.sample(label_ids, rng.randint(0, per_task))
+    ], batch_size=batch_size)
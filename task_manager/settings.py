@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 
 import dj_database_url
@@ -37,8 +38,11 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'task_manager.middleware.MetricsMiddleware',
+    'task_manager.middleware.ServerTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'task_manager.middleware.StaticFilesMiddleware',
+    'task_manager.middleware.ReplicaMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.locale.LocaleMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -53,6 +57,27 @@ if not DEBUG:
         'rollbar.contrib.django.middleware.RollbarNotifierMiddleware',
     )
 
+# per-request SQL/view/template timings in the Server-Timing header
+SERVER_TIMING = os.getenv('SERVER_TIMING', False)
+SLOW_REQUEST_THRESHOLD_MS = int(os.getenv('SLOW_REQUEST_THRESHOLD_MS', 500))
+
+# days of task changes kept for the delta sync endpoint
+TASK_CHANGES_RETENTION_DAYS = int(
+    os.getenv('TASK_CHANGES_RETENTION_DAYS', 30)
+)
+
+# per-route request metrics, shared between workers through METRICS_DIR
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', False)
+METRICS_DIR = os.getenv('METRICS_DIR')
+METRICS_TOKEN = os.getenv('METRICS_TOKEN')
+METRICS_FLUSH_SECONDS = float(os.getenv('METRICS_FLUSH_SECONDS', 1))
+
+# bearer token of integrations using the JSON API without a session
+API_TOKEN = os.getenv('API_TOKEN')
+
+# async list and detail views for ASGI servers
+ASYNC_VIEWS = os.getenv('ASYNC_VIEWS', False)
+
 ROOT_URLCONF = 'task_manager.urls'
 
 # render template
@@ -89,6 +114,106 @@ if DATABASE_URL:
         default=DATABASE_URL, conn_max_age=600, conn_health_checks=True,
     )
 
+# applied to every SQLite connection; WAL lets readers work next to a writer
+# and IMMEDIATE transactions wait for the write lock instead of failing
+SQLITE_PRAGMAS = os.getenv(
+    'SQLITE_PRAGMAS',
+    'journal_mode=WAL;synchronous=NORMAL;busy_timeout=5000;'
+    'mmap_size=268435456',
+)
+SQLITE_TRANSACTION_MODE = os.getenv('SQLITE_TRANSACTION_MODE', 'IMMEDIATE')
+
+# read-only views read from the replica, see task_manager/routers.py
+REPLICA_DATABASE_URL = os.getenv('REPLICA_DATABASE_URL')
+REPLICA_PIN_COOKIE = 'primary_pin'
+REPLICA_PIN_SECONDS = int(os.getenv('REPLICA_PIN_SECONDS', 5))
+
+if REPLICA_DATABASE_URL:
+    DATABASES['replica'] = dj_database_url.parse(
+        REPLICA_DATABASE_URL, conn_max_age=600, conn_health_checks=True,
+    )
+    DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+    DATABASE_ROUTERS = ['task_manager.routers.ReplicaRouter']
+
+for database in DATABASES.values():
+    if database['ENGINE'] != 'django.db.backends.sqlite3':
+        continue
+    database.setdefault('OPTIONS', {}).update(
+        init_command=';'.join(
+            f'PRAGMA {pragma}'
+            for pragma in SQLITE_PRAGMAS.split(';') if pragma
+        ),
+        transaction_mode=SQLITE_TRANSACTION_MODE or None,
+    )
+
+# psycopg 3 connection pool per worker instead of persistent connections
+DB_POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE', 0))
+DB_POOL_MIN_SIZE = int(os.getenv('DB_POOL_MIN_SIZE', 2))
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 10))
+
+for database in DATABASES.values():
+    if not DB_POOL_MAX_SIZE \
+            or database['ENGINE'] != 'django.db.backends.postgresql':
+        continue
+    database.update(CONN_MAX_AGE=0, CONN_HEALTH_CHECKS=False)
+    database.setdefault('OPTIONS', {})['pool'] = {
+        'min_size': DB_POOL_MIN_SIZE,
+        'max_size': DB_POOL_MAX_SIZE,
+        'timeout': DB_POOL_TIMEOUT,
+    }
+
+# shared tier in the database (or CACHE_DIR), per-process tier in memory
+CACHE_DIR = os.getenv('CACHE_DIR')
+CACHE_LOCAL_TIMEOUT = int(os.getenv('CACHE_LOCAL_TIMEOUT', 300))
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'cache_entries',
+    },
+    'local': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'task_manager',
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    },
+}
+
+if CACHE_DIR:
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': CACHE_DIR,
+    }
+
+# "cached" reads sessions from a file cache shared by the workers of a host,
+# "cache" keeps them there only; both keep messages in a cookie
+SESSION_PROFILE = os.getenv('SESSION_PROFILE', 'database')
+SESSION_PROFILES = {
+    'database': (
+        'django.contrib.sessions.backends.db',
+        'django.contrib.messages.storage.fallback.FallbackStorage',
+    ),
+    'cached': (
+        'django.contrib.sessions.backends.cached_db',
+        'django.contrib.messages.storage.cookie.CookieStorage',
+    ),
+    'cache': (
+        'django.contrib.sessions.backends.cache',
+        'django.contrib.messages.storage.cookie.CookieStorage',
+    ),
+}
+SESSION_ENGINE, MESSAGE_STORAGE = SESSION_PROFILES[SESSION_PROFILE]
+SESSION_CACHE_ALIAS = 'sessions'
+
+# never culled, so no session is dropped before it expires; run
+# clear_sessions to remove expired ones
+CACHES['sessions'] = {
+    'BACKEND': 'task_manager.cache.SessionFileCache',
+    'LOCATION': os.getenv(
+        'SESSION_CACHE_DIR',
+        os.path.join(tempfile.gettempdir(), 'task_manager_sessions'),
+    ),
+}
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',
@@ -2,4 +2,8 @@ from django.contrib import admin
 
 from task_manager.statuses.models import Status
 
-admin.site.register(Status)
+
+@admin.register(Status)
+class StatusAdmin(admin.ModelAdmin):
+    list_display = ('name', 'created_at')
+    search_fields = ('name',)
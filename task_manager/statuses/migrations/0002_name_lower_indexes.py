@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-18 12:36
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('statuses', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='status',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='status_name_lower_idx'),
+        ),
+    ]
@@ -1,5 +1,8 @@
+from unittest.mock import patch
+
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models.deletion import ProtectedError
+from django.db.models.deletion import Collector, ProtectedError
+from django.contrib.messages import get_messages
 from django.test import TestCase, Client
 from django.urls import reverse_lazy
 
@@ -106,6 +109,22 @@ class StatusesTest(TestCase):
         with self.assertRaises(ObjectDoesNotExist):
             Status.objects.get(id=self.status1.id)
 
+    def test_status_update_and_delete_queries(self):
+        with self.assertNumQueries(3):
+            self.client.get(
+                reverse_lazy('update_status', args=[self.status1.id])
+            )
+        with self.assertNumQueries(3):
+            self.client.get(
+                reverse_lazy('delete_status', args=[self.status1.id])
+            )
+        with self.assertNumQueries(11):
+            response = self.client.post(
+                reverse_lazy('delete_status', args=[self.status1.id])
+            )
+
+        self.assertRedirects(response, reverse_lazy('statuses'))
+
     def test_status_delete_linked(self):
         before_objs_len = len(Status.objects.all())
         self.client.post(
@@ -117,3 +136,25 @@ class StatusesTest(TestCase):
             expected_exception=ProtectedError,
             expected_message=texts.messages['protected_status']
         )
+
+    def test_statuses_usage_count(self):
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse_lazy('statuses'))
+
+        self.assertEqual(
+            [status.usage_count for status in response.context['statuses']],
+            [0, 2, 1]
+        )
+
+    def test_status_delete_linked_without_collector(self):
+        with patch.object(Collector, 'collect') as collect:
+            response = self.client.post(
+                reverse_lazy('delete_status', args=[self.status2.id])
+            )
+
+        collect.assert_not_called()
+        self.assertRedirects(response, reverse_lazy('statuses'))
+        self.assertEqual(
+            [str(message) for message in get_messages(response.wsgi_request)],
+            [texts.messages['protected_status']]
+        )
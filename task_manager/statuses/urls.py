@@ -1,9 +1,16 @@
 from django.urls import path
 
+from task_manager.async_views import select_view
 from task_manager.statuses import views
 
 urlpatterns = [
-    path('', views.StatusesListView.as_view(), name='statuses'),
+    path(
+        '',
+        select_view(
+            views.StatusesListView, views.AsyncStatusesListView
+        ).as_view(),
+        name='statuses'
+    ),
     path('create/', views.StatusCreateView.as_view(), name='create_status'),
     path(
         '<int:pk>/update/',
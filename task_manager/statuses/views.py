@@ -3,12 +3,16 @@ from django.urls import reverse_lazy
 from django.views.generic import CreateView, ListView, UpdateView, DeleteView
 
 from task_manager import texts
-from task_manager.mixins import AuthCheckMixin, ProtectDeleteMixin
+from task_manager.async_views import AsyncListView
+from task_manager.mixins import (
+    AsyncAuthCheckMixin, AuthCheckMixin, ProtectDeleteMixin, ReplicaReadMixin,
+    UsageCountMixin,
+)
 from task_manager.statuses.forms import StatusForm
 from task_manager.statuses.models import Status
 
 
-class StatusesListView(AuthCheckMixin, ListView):
+class StatusesListMixin(ReplicaReadMixin, UsageCountMixin):
     template_name = 'statuses/statuses.html'
     model = Status
     context_object_name = 'statuses'
@@ -19,6 +23,16 @@ class StatusesListView(AuthCheckMixin, ListView):
     }
 
 
+class StatusesListView(AuthCheckMixin, StatusesListMixin, ListView):
+    pass
+
+
+class AsyncStatusesListView(
+    AsyncAuthCheckMixin, StatusesListMixin, AsyncListView
+):
+    pass
+
+
 class StatusCreateView(AuthCheckMixin, SuccessMessageMixin, CreateView):
     template_name = 'form.html'
     model = Status
@@ -1,5 +1,75 @@
-from django.contrib import admin
+from functools import partial
 
-from task_manager.tasks.models import Task
+from django.contrib import admin, messages
+from django.db import transaction
 
-admin.site.register(Task)
+from task_manager import texts
+from task_manager.pagination import CappedCountAdminMixin
+from task_manager.refdata import snapshot
+from task_manager.statuses.models import Status
+from task_manager.tasks.bulk import bulk_change
+from task_manager.tasks.models import Task, TaskLabelLinks
+from task_manager.tasks.search import search
+
+
+class TaskLabelLinksInline(admin.TabularInline):
+    model = TaskLabelLinks
+    autocomplete_fields = ('label',)
+    extra = 0
+
+
+@admin.register(Task)
+class TaskAdmin(CappedCountAdminMixin, admin.ModelAdmin):
+    list_display = ('name', 'status', 'author', 'executor', 'created_at')
+    list_select_related = ('status', 'author', 'executor')
+    list_filter = ('status', 'labels')
+    search_fields = ('name', 'description')
+    autocomplete_fields = ('status', 'author', 'executor')
+    inlines = (TaskLabelLinksInline,)
+    actions = ('delete_tasks', 'assign_to_me')
+
+    def get_search_results(self, request, queryset, search_term):
+        return search(queryset, search_term), False
+
+    def get_actions(self, request):
+        actions = super().get_actions(request)
+        # lists every selected task before deleting them one by one,
+        # delete_tasks deletes them as a set instead
+        actions.pop('delete_selected', None)
+        for pk, row in snapshot(Status).items():
+            name = f'set_status_{pk}'
+            actions[name] = (
+                partial(set_status, status=Status(pk=pk)),
+                name,
+                texts.messages['admin_set_status'] % {'status': row[1]},
+            )
+        return actions
+
+    @admin.action(
+        description=texts.messages['admin_delete_tasks'],
+        permissions=('delete',),
+    )
+    def delete_tasks(self, request, queryset):
+        with transaction.atomic():
+            _, deleted = queryset.delete()
+        messages.success(
+            request, texts.messages['tasks_bulk_deleted'] % {
+                'count': deleted.get(Task._meta.label, 0),
+            }
+        )
+
+    @admin.action(description=texts.messages['admin_assign_to_me'])
+    def assign_to_me(self, request, queryset):
+        report_change(
+            request, bulk_change(queryset, executor=request.user)
+        )
+
+
+def set_status(modeladmin, request, queryset, status):
+    report_change(request, bulk_change(queryset, status=status))
+
+
+def report_change(request, count):
+    messages.success(
+        request, texts.messages['tasks_bulk_changed'] % {'count': count}
+    )
@@ -1,6 +1,26 @@
 from django.apps import AppConfig
+from django.db.models.signals import (
+    m2m_changed, post_delete, post_init, post_migrate, post_save,
+)
 
 
 class TasksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'task_manager.tasks'
+
+    def ready(self):
+        from task_manager.tasks.changes import record_task
+        from task_manager.tasks.models import Task
+        from task_manager.tasks.search import restore_search_triggers
+        from task_manager.tasks.signals import (
+            DISPLAYED_FIELDS, remember_displayed_values, touch_displaying_tasks,
+            touch_labelled_tasks,
+        )
+
+        post_migrate.connect(restore_search_triggers, sender=self)
+        post_save.connect(record_task, sender=Task)
+        post_delete.connect(record_task, sender=Task)
+        m2m_changed.connect(touch_labelled_tasks, sender=Task.labels.through)
+        for model in DISPLAYED_FIELDS:
+            post_init.connect(remember_displayed_values, sender=model)
+            post_save.connect(touch_displaying_tasks, sender=model)
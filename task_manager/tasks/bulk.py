@@ -0,0 +1,40 @@
+from django.db import transaction
+from django.utils import timezone
+
+from task_manager.tasks.changes import record
+from task_manager.tasks.export import chunked
+from task_manager.tasks.models import Task, TaskLabelLinks
+
+BATCH_SIZE = 1000
+
+
+def bulk_change(queryset, status=None, executor=None, add_labels=(),
+                remove_labels=(), batch_size=BATCH_SIZE):
+    changes = {'updated_at': timezone.now()}
+    if status:
+        changes['status'] = status
+    if executor:
+        changes['executor'] = executor
+    with transaction.atomic():
+        ids = list(queryset.order_by().values_list('pk', flat=True))
+        for chunk in chunked(ids, batch_size):
+            change_batch(chunk, changes, add_labels, remove_labels)
+    return len(ids)
+
+
+def change_batch(ids, changes, add_labels, remove_labels):
+    Task.objects.filter(pk__in=ids).update(**changes)
+    record(ids)
+    if remove_labels:
+        TaskLabelLinks.objects.filter(
+            task_id__in=ids, label__in=remove_labels
+        ).delete()
+    if add_labels:
+        TaskLabelLinks.objects.bulk_create(
+            [
+                TaskLabelLinks(task_id=task_id, label=label)
+                for task_id in ids
+                for label in add_labels
+            ],
+            ignore_conflicts=True,
+        )
@@ -0,0 +1,185 @@
+from datetime import timedelta
+
+from django.db import connections, router, transaction
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+
+from task_manager.pagination import (
+    InvalidCursor, decode_cursor, encode_cursor,
+)
+from task_manager.tasks.export import export_rows
+from task_manager.tasks.models import Task, TaskChange
+
+TOKEN = 's'
+LIMIT = 500
+BATCH_SIZE = 1000
+POSITION = ('transaction_id', 'id')
+
+# PostgreSQL hands out ids at insert time, not at commit, so changes are
+# ordered by writing transaction and only read once every older
+# transaction has finished: no change can appear behind a served token.
+TRANSACTION_ID = {
+    'postgresql': 'SELECT pg_current_xact_id()::text::bigint',
+}
+OLDEST_RUNNING_TRANSACTION = {
+    'postgresql':
+        'SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint',
+}
+
+
+def query_value(queries, using):
+    connection = connections[using]
+    if connection.vendor not in queries:
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(queries[connection.vendor])
+        return cursor.fetchone()[0]
+
+
+def record(task_ids):
+    """Log changes of ``task_ids``, after the changes themselves."""
+    using = router.db_for_write(TaskChange)
+    if connections[using].vendor not in TRANSACTION_ID:
+        return save(task_ids, 0, using)
+    # the id must be the one of the transaction inserting the changes
+    with transaction.atomic(using=using):
+        save(task_ids, query_value(TRANSACTION_ID, using), using)
+
+
+def save(task_ids, transaction_id, using):
+    TaskChange.objects.using(using).bulk_create([
+        TaskChange(transaction_id=transaction_id, task_id=task_id)
+        for task_id in task_ids
+    ], batch_size=BATCH_SIZE)
+
+
+def record_task(sender, instance, **kwargs):
+    record([instance.pk])
+
+
+def encode_token(position):
+    return encode_cursor(TOKEN, list(position))
+
+
+def decode_token(token):
+    kind, values = decode_cursor(token)
+    if kind != TOKEN or len(values) != len(POSITION) or any(
+        type(value) is not int or value < 0 for value in values
+    ):
+        raise InvalidCursor(token)
+    return tuple(values)
+
+
+def after(position):
+    transaction_id, change_id = position
+    return Q(transaction_id__gte=transaction_id) & (
+        Q(transaction_id__gt=transaction_id)
+        | Q(transaction_id=transaction_id, pk__gt=change_id)
+    )
+
+
+def settled(queryset):
+    """Changes whose transactions, and all older ones, have finished."""
+    oldest_running = query_value(OLDEST_RUNNING_TRANSACTION, queryset.db)
+    if oldest_running is None:
+        return queryset
+    return queryset.filter(transaction_id__lt=oldest_running)
+
+
+def change_state():
+    """Time and state of the change log for list validators.
+
+    The state is the newest settled change plus the number and newest id
+    of the visible changes past it: changes committed while an older
+    transaction holds the settled position back still move it. ``None``
+    when the log is empty.
+    """
+    queryset = TaskChange.objects.all()
+    oldest_running = query_value(OLDEST_RUNNING_TRANSACTION, queryset.db)
+    pending = {'count': 0, 'newest': None, 'changed_at': None}
+    if oldest_running is not None:
+        pending = queryset.filter(
+            transaction_id__gte=oldest_running
+        ).aggregate(
+            count=Count('pk'), newest=Max('pk'), changed_at=Max('created_at')
+        )
+        queryset = queryset.filter(transaction_id__lt=oldest_running)
+    latest = queryset.order_by('-transaction_id', '-pk').values_list(
+        *POSITION, 'created_at'
+    ).first()
+    if latest is None and not pending['count']:
+        return None
+    *position, changed_at = latest or (None, None, None)
+    changed_at = max(filter(None, [changed_at, pending['changed_at']]))
+    return changed_at, (
+        tuple(position), pending['count'], pending['newest']
+    )
+
+
+def latest_position():
+    return settled(TaskChange.objects.all()).order_by(
+        '-transaction_id', '-pk'
+    ).values_list(*POSITION).first() or (0, 0)
+
+
+def is_pruned(position):
+    """Whether changes after ``position`` may have been pruned.
+
+    A token taken from an empty log also counts, which costs its client
+    one extra reload.
+    """
+    oldest = TaskChange.objects.order_by(*POSITION).values_list(
+        *POSITION
+    ).first()
+    return oldest is not None and tuple(position) < oldest
+
+
+def reset():
+    return {
+        'token': encode_token(latest_position()),
+        'reset': True,
+        'more': False,
+        'changed': [],
+        'deleted': [],
+    }
+
+
+def changes_since(position, limit=LIMIT):
+    """Return the tasks changed after ``position``, oldest change first.
+
+    A task changed several times is returned once, in its current state.
+    """
+    changes = list(
+        settled(TaskChange.objects.filter(after(position)))
+        .order_by(*POSITION)
+        .values_list(*POSITION, 'task_id')[:limit + 1]
+    )
+    more = len(changes) > limit
+    changes = changes[:limit]
+    task_ids = list(dict.fromkeys(change[-1] for change in changes))
+    changed = list(export_rows(Task.objects.filter(pk__in=task_ids)))
+    existing = {row['id'] for row in changed}
+    return {
+        'token': encode_token(changes[-1][:2] if changes else position),
+        'reset': False,
+        'more': more,
+        'changed': changed,
+        'deleted': [pk for pk in task_ids if pk not in existing],
+    }
+
+
+def prune(days):
+    """Delete changes older than ``days`` except the newest of them.
+
+    The kept change tells tokens older than the log from new ones.
+    """
+    cutoff = timezone.now() - timedelta(days=days)
+    newest = TaskChange.objects.filter(created_at__lt=cutoff).order_by(
+        '-transaction_id', '-pk'
+    ).values_list(*POSITION).first()
+    if newest is None:
+        return 0
+    deleted, _ = TaskChange.objects.exclude(after(newest)).exclude(
+        transaction_id=newest[0], pk=newest[1]
+    ).delete()
+    return deleted
@@ -0,0 +1,90 @@
+import csv
+import json
+from collections import defaultdict
+from itertools import islice
+
+from task_manager.tasks.models import TaskLabelLinks
+
+EXPORT_FIELDS = (
+    'id',
+    'name',
+    'description',
+    'status',
+    'author',
+    'executor',
+    'labels',
+    'created_at',
+)
+LABELS_SEPARATOR = ';'
+CHUNK_SIZE = 2000
+ROWS_PER_WRITE = 200
+
+
+def export_rows(queryset):
+    rows = queryset.values_list(
+        'id', 'name', 'description', 'status__name',
+        'author__username', 'executor__username', 'created_at',
+    ).iterator(chunk_size=CHUNK_SIZE)
+    for chunk in chunked(rows, CHUNK_SIZE):
+        labels = task_labels([row[0] for row in chunk])
+        for pk, name, description, status, author, executor, created_at \
+                in chunk:
+            yield {
+                'id': pk,
+                'name': name,
+                'description': description or '',
+                'status': status,
+                'author': author,
+                'executor': executor or '',
+                'labels': labels.get(pk, []),
+                'created_at': created_at.isoformat(),
+            }
+
+
+def task_labels(task_ids):
+    labels = defaultdict(list)
+    links = TaskLabelLinks.objects.filter(task_id__in=task_ids).values_list(
+        'task_id', 'label__name'
+    ).order_by('task_id', 'label_id')
+    for task_id, label in links:
+        labels[task_id].append(label)
+    return labels
+
+
+class Echo:
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for chunk in chunked(rows, ROWS_PER_WRITE):
+        yield ''.join(
+            writer.writerow([
+                LABELS_SEPARATOR.join(row[field]) if field == 'labels'
+                else row[field]
+                for field in EXPORT_FIELDS
+            ])
+            for row in chunk
+        )
+
+
+def stream_jsonl(rows):
+    for chunk in chunked(rows, ROWS_PER_WRITE):
+        yield ''.join(
+            json.dumps(row, ensure_ascii=False) + '\n' for row in chunk
+        )
+
+
+def chunked(rows, size):
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+FORMATS = {
+    'csv': (stream_csv, 'text/csv; charset=utf-8'),
+    'jsonl': (stream_jsonl, 'application/x-ndjson; charset=utf-8'),
+}
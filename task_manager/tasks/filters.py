@@ -1,14 +1,48 @@
 from django import forms
-from django_filters import FilterSet, ModelChoiceFilter, BooleanFilter
+from django_filters import (
+    BooleanFilter, CharFilter, FilterSet, ModelChoiceFilter,
+)
+from django_filters.fields import ModelChoiceField
 
 from task_manager import texts
 from task_manager.labels.models import Label
+from task_manager.refdata import ReferenceChoiceField
+from task_manager.statuses.models import Status
 from task_manager.tasks.models import Task
+from task_manager.tasks.search import search
+from task_manager.users.models import User
+from task_manager.widgets import AutocompleteSelect
+
+
+class ReferenceFilterField(ReferenceChoiceField, ModelChoiceField):
+    pass
+
+
+class ReferenceChoiceFilter(ModelChoiceFilter):
+    field_class = ReferenceFilterField
 
 
 class TaskFilter(FilterSet):
-    labels = ModelChoiceFilter(
+    search = CharFilter(
+        method='get_search',
+        label=texts.create_tasks['task_search']
+    )
+
+    status = ReferenceChoiceFilter(
+        queryset=Status.objects.all(),
+        widget=AutocompleteSelect('autocomplete_statuses'),
+        label=texts.create_tasks['task_status']
+    )
+
+    executor = ReferenceChoiceFilter(
+        queryset=User.objects.all(),
+        widget=AutocompleteSelect('autocomplete_users'),
+        label=texts.create_tasks['task_executor']
+    )
+
+    labels = ReferenceChoiceFilter(
         queryset=Label.objects.all(),
+        widget=AutocompleteSelect('autocomplete_labels'),
         label=texts.create_tasks['task_label']
     )
 
@@ -18,12 +52,23 @@ class TaskFilter(FilterSet):
         label=texts.create_tasks['personal_tasks']
     )
 
+    def __init__(self, data=None, queryset=None, **kwargs):
+        if queryset is None:
+            queryset = Task.objects.with_related()
+        super().__init__(data, queryset, **kwargs)
+
     def get_personal(self, queryset, _, value):
         if value:
             user = self.request.user
+            if not user.is_authenticated:
+                # API token requests have no user of their own
+                return queryset.none()
             return queryset.filter(author=user)
         return queryset
 
+    def get_search(self, queryset, _, value):
+        return search(queryset, value)
+
     class Meta:
         model = Task
         fields = ['status', 'executor']
@@ -1,6 +1,14 @@
 from django import forms
 
+from task_manager import texts
+from task_manager.labels.models import Label
+from task_manager.refdata import (
+    ReferenceChoiceField, ReferenceMultipleChoiceField,
+)
+from task_manager.statuses.models import Status
 from task_manager.tasks.models import Task
+from task_manager.users.models import User
+from task_manager.widgets import AutocompleteSelect, AutocompleteSelectMultiple
 
 
 class TaskForm(forms.ModelForm):
@@ -8,3 +16,61 @@ class TaskForm(forms.ModelForm):
     class Meta:
         model = Task
         fields = ('name', 'description', 'status', 'executor', 'labels')
+        widgets = {
+            'status': AutocompleteSelect('autocomplete_statuses'),
+            'executor': AutocompleteSelect('autocomplete_users'),
+            'labels': AutocompleteSelectMultiple('autocomplete_labels'),
+        }
+        field_classes = {
+            'status': ReferenceChoiceField,
+            'executor': ReferenceChoiceField,
+            'labels': ReferenceMultipleChoiceField,
+        }
+
+
+class TaskBulkForm(forms.Form):
+    tasks = forms.ModelMultipleChoiceField(
+        queryset=Task.objects.only('pk'),
+        required=False,
+        widget=forms.MultipleHiddenInput
+    )
+    all_matching = forms.BooleanField(
+        required=False,
+        label=texts.create_tasks['bulk_all_matching']
+    )
+    status = ReferenceChoiceField(
+        queryset=Status.objects.all(),
+        required=False,
+        widget=AutocompleteSelect('autocomplete_statuses'),
+        label=texts.create_tasks['bulk_status']
+    )
+    executor = ReferenceChoiceField(
+        queryset=User.objects.all(),
+        required=False,
+        widget=AutocompleteSelect('autocomplete_users'),
+        label=texts.create_tasks['bulk_executor']
+    )
+    add_labels = ReferenceMultipleChoiceField(
+        queryset=Label.objects.all(),
+        required=False,
+        widget=AutocompleteSelectMultiple('autocomplete_labels'),
+        label=texts.create_tasks['bulk_add_labels']
+    )
+    remove_labels = ReferenceMultipleChoiceField(
+        queryset=Label.objects.all(),
+        required=False,
+        widget=AutocompleteSelectMultiple('autocomplete_labels'),
+        label=texts.create_tasks['bulk_remove_labels']
+    )
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if not cleaned_data.get('tasks') and not cleaned_data.get(
+            'all_matching'
+        ):
+            raise forms.ValidationError(texts.messages['bulk_no_tasks'])
+        if not any(cleaned_data.get(field) for field in (
+            'status', 'executor', 'add_labels', 'remove_labels'
+        )):
+            raise forms.ValidationError(texts.messages['bulk_no_changes'])
+        return cleaned_data
@@ -0,0 +1,39 @@
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+
+from task_manager import texts
+from task_manager.cache import fragment_cache
+from task_manager.tasks.models import Task
+
+ROW_TEMPLATE = 'tasks/task_row.html'
+# only the columns the keyset cursors and the row keys need
+ROW_KEY_FIELDS = ('id', 'created_at', 'updated_at')
+
+
+def row_key(task):
+    return 'tasks:row:{}:{}:{}:{}'.format(
+        get_language(),
+        timezone.get_current_timezone_name(),
+        task.pk,
+        task.updated_at.timestamp(),
+    )
+
+
+def render_rows(tasks):
+    """Return the table rows of ``tasks``, rendering only changed tasks."""
+    keys = {row_key(task): task.pk for task in tasks}
+    rows = fragment_cache.get_many(list(keys))
+    missing = {key: pk for key, pk in keys.items() if key not in rows}
+    if missing:
+        changed = Task.objects.with_related().in_bulk(missing.values())
+        rendered = {
+            key: render_to_string(ROW_TEMPLATE, {
+                'task': changed[pk], 'texts': texts.create_tasks,
+            })
+            for key, pk in missing.items() if pk in changed
+        }
+        fragment_cache.set_many(rendered)
+        rows.update(rendered)
+    return [mark_safe(rows[key]) for key in keys if key in rows]
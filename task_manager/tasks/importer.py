@@ -0,0 +1,181 @@
+import csv
+import json
+import time
+
+from django.db import IntegrityError, transaction
+
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.changes import record
+from task_manager.tasks.export import LABELS_SEPARATOR, chunked
+from task_manager.tasks.models import Task, TaskLabelLinks
+from task_manager.users.models import User
+
+NAME_MAX_LENGTH = Task._meta.get_field('name').max_length
+
+
+class RowError(Exception):
+    pass
+
+
+def read_csv(stream):
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def read_jsonl(stream):
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as error:
+            yield line_number, RowError(f'invalid JSON: {error}')
+            continue
+        if not isinstance(row, dict):
+            row = RowError('expected a JSON object')
+        yield line_number, row
+
+
+READERS = {
+    'csv': read_csv,
+    'jsonl': read_jsonl,
+}
+
+
+class TaskImporter:
+
+    def __init__(self, batch_size=1000, default_author=None,
+                 create_missing=False):
+        self.batch_size = batch_size
+        self.create_missing = create_missing
+        self.statuses = dict(Status.objects.values_list('name', 'id'))
+        self.labels = dict(Label.objects.values_list('name', 'id'))
+        self.users = dict(User.objects.values_list('username', 'id'))
+        self.default_author = default_author
+        self.seen_names = set()
+        self.imported = 0
+        self.errors = []
+        self.started = time.perf_counter()
+
+    @property
+    def rate(self):
+        elapsed = time.perf_counter() - self.started
+        return self.imported / elapsed if elapsed else 0.0
+
+    def run(self, rows, progress=None):
+        for batch in chunked(rows, self.batch_size):
+            self.import_batch(batch)
+            if progress:
+                progress(self)
+        return self
+
+    def import_batch(self, batch):
+        prepared = self.skip_existing(self.prepare(batch))
+        try:
+            with transaction.atomic():
+                self.save(prepared)
+        except IntegrityError:
+            for item in prepared:
+                self.save_one(item)
+            return
+        self.imported += len(prepared)
+
+    def prepare(self, batch):
+        prepared = []
+        for line_number, row in batch:
+            try:
+                prepared.append((line_number, *self.build(row)))
+            except RowError as error:
+                self.errors.append((line_number, str(error)))
+        return prepared
+
+    def save(self, prepared):
+        tasks = Task.objects.bulk_create(
+            [task for _, task, _ in prepared], batch_size=self.batch_size
+        )
+        TaskLabelLinks.objects.bulk_create([
+            TaskLabelLinks(task_id=task.pk, label_id=label_id)
+            for task, (_, _, label_ids) in zip(tasks, prepared)
+            for label_id in label_ids
+        ], batch_size=self.batch_size)
+        record(task.pk for task in tasks)
+
+    def save_one(self, item):
+        item[1].pk = None
+        try:
+            with transaction.atomic():
+                self.save([item])
+        except IntegrityError as error:
+            self.errors.append((item[0], str(error)))
+        else:
+            self.imported += 1
+
+    def skip_existing(self, prepared):
+        existing = set(Task.objects.filter(
+            name__in=[task.name for _, task, _ in prepared]
+        ).values_list('name', flat=True))
+        for line_number, task, _ in prepared:
+            if task.name in existing:
+                self.errors.append(
+                    (line_number, f'task "{task.name}" already exists')
+                )
+        return [item for item in prepared if item[1].name not in existing]
+
+    def build(self, row):
+        if isinstance(row, RowError):
+            raise row
+        name = self.clean_name(row.get('name'))
+        task = Task(
+            name=name,
+            description=row.get('description') or '',
+            status_id=self.status_id(row.get('status')),
+            author_id=self.user_id(
+                row.get('author') or self.default_author, 'author'
+            ),
+            executor_id=self.user_id(row.get('executor'), 'executor')
+            if row.get('executor') else None,
+        )
+        label_ids = {self.label_id(label) for label in self.label_names(row)}
+        self.seen_names.add(name)
+        return task, sorted(label_ids)
+
+    def clean_name(self, name):
+        name = (name or '').strip()
+        if not name:
+            raise RowError('name is required')
+        if len(name) > NAME_MAX_LENGTH:
+            raise RowError(f'name is longer than {NAME_MAX_LENGTH} characters')
+        if name in self.seen_names:
+            raise RowError(f'task "{name}" is repeated in the file')
+        return name
+
+    def status_id(self, name):
+        if not name:
+            raise RowError('status is required')
+        return self.lookup(self.statuses, Status, name, 'status')
+
+    def label_id(self, name):
+        return self.lookup(self.labels, Label, name, 'label')
+
+    def user_id(self, username, role):
+        if not username:
+            raise RowError(f'{role} is required')
+        if username not in self.users:
+            raise RowError(f'unknown {role} "{username}"')
+        return self.users[username]
+
+    def lookup(self, known, model, name, kind):
+        if name not in known:
+            if not self.create_missing:
+                raise RowError(f'unknown {kind} "{name}"')
+            known[name] = model.objects.get_or_create(name=name)[0].pk
+        return known[name]
+
+    @staticmethod
+    def label_names(row):
+        labels = row.get('labels') or []
+        if isinstance(labels, str):
+            labels = labels.split(LABELS_SEPARATOR)
+        return [str(label).strip() for label in labels if str(label).strip()]
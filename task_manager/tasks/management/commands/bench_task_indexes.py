@@ -0,0 +1,167 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, models, transaction
+from django.test import RequestFactory
+
+from task_manager.benchmarks import percentiles
+from task_manager.pagination import KeysetPaginator, encode_cursor
+from task_manager.seed import generate_dataset
+from task_manager.tasks.filters import TaskFilter
+from task_manager.tasks.models import Task, TaskLabelLinks
+from task_manager.users.models import User
+
+PAGE_SIZE = 50
+
+BASELINE_INDEXES = (
+    (Task, 'status'),
+    (Task, 'executor'),
+    (Task, 'author'),
+    (TaskLabelLinks, 'task'),
+    (TaskLabelLinks, 'label'),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares query plans and latency of the TaskFilter query shapes '
+        'with the task indexes and with the single-column baseline.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tasks', type=int, default=0,
+            help='Generate this many benchmark tasks before measuring.',
+        )
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--statuses', type=int, default=10)
+        parser.add_argument('--labels', type=int, default=50)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--repeat', type=int, default=20)
+        parser.add_argument(
+            '--explain', action='store_true',
+            help='Print the query plan of every shape.',
+        )
+
+    def handle(self, *args, **options):
+        if options['tasks']:
+            generate_dataset(
+                users=options['users'],
+                statuses=options['statuses'],
+                labels=options['labels'],
+                tasks=options['tasks'],
+                seed=options['seed'],
+            )
+        if not Task.objects.exists():
+            raise CommandError('No tasks to benchmark, use --tasks.')
+        shapes = self.get_shapes()
+        self.analyze()
+        after = self.measure(shapes, options)
+        with transaction.atomic():
+            self.use_baseline_indexes()
+            self.analyze()
+            before = self.measure(shapes, options)
+            transaction.set_rollback(True)
+        self.report(before, after, options)
+
+    def get_shapes(self):
+        sample = Task.objects.order_by('pk').first()
+        link = TaskLabelLinks.objects.order_by('pk').first()
+        total = Task.objects.count()
+        deep = Task.objects.values('created_at', 'id')[total * 9 // 10]
+        status = {'status': sample.status_id}
+        label = {'labels': link.label_id} if link else {}
+        return [
+            ('all', {}, None),
+            ('deep page', {}, deep),
+            ('status', status, None),
+            ('executor', {'executor': sample.executor_id or ''}, None),
+            ('label', label, None),
+            ('personal', {'personal': 'on'}, None),
+            ('status + executor', {
+                **status, 'executor': sample.executor_id or '',
+            }, None),
+            ('status + label', {**status, **label}, None),
+            ('status + label deep', {**status, **label}, deep),
+            ('search', {'search': sample.name}, None),
+        ]
+
+    def measure(self, shapes, options):
+        request = RequestFactory().get('/tasks/')
+        request.user = User.objects.get(pk=Task.objects.first().author_id)
+        results = {}
+        for name, data, deep in shapes:
+            filterset = TaskFilter(data, request=request)
+            paginator = KeysetPaginator(filterset.qs, PAGE_SIZE)
+            cursor = encode_cursor(
+                KeysetPaginator.NEXT, [deep['created_at'], deep['id']]
+            ) if deep else None
+            timings = []
+            for _ in range(options['repeat']):
+                started = time.perf_counter()
+                paginator.get_page(cursor)
+                timings.append((time.perf_counter() - started) * 1000)
+            plan = paginator.get_queryset(
+                *paginator.parse_cursor(cursor)
+            ).explain()
+            results[name] = (timings, plan)
+        return results
+
+    def use_baseline_indexes(self):
+        schema_editor = connection.schema_editor()
+        statements = []
+        for model in (Task, TaskLabelLinks):
+            for index in model._meta.indexes:
+                statements.append(schema_editor.sql_delete_index % {
+                    'table': schema_editor.quote_name(model._meta.db_table),
+                    'name': schema_editor.quote_name(index.name),
+                })
+        if connection.vendor != 'sqlite':
+            statements.append(schema_editor.sql_delete_unique % {
+                'table': schema_editor.quote_name(
+                    TaskLabelLinks._meta.db_table
+                ),
+                'name': schema_editor.quote_name('unique_label_task'),
+            })
+        for model, field in BASELINE_INDEXES:
+            index = models.Index(
+                fields=[field], name=f'bench_{model._meta.model_name}_{field}'
+            )
+            statements.append(str(index.create_sql(model, schema_editor)))
+        with connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+
+    def analyze(self):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def report(self, before, after, options):
+        self.stdout.write(
+            f'{connection.vendor}, {Task.objects.count()} tasks, '
+            f'{options["repeat"]} runs per shape, times in ms'
+        )
+        if connection.vendor == 'sqlite':
+            self.stdout.write(
+                'SQLite keeps the inline unique (label, task) index '
+                'in the baseline run.'
+            )
+        self.stdout.write(
+            f'{"shape":<22}{"before p50":>12}{"before p95":>12}'
+            f'{"after p50":>12}{"after p95":>12}{"speedup":>10}'
+        )
+        for name, (after_timings, after_plan) in after.items():
+            before_timings, before_plan = before[name]
+            old = percentiles(before_timings, (50, 95))
+            new = percentiles(after_timings, (50, 95))
+            self.stdout.write(
+                f'{name:<22}{old[0]:>12.2f}{old[1]:>12.2f}'
+                f'{new[0]:>12.2f}{new[1]:>12.2f}{old[0] / new[0]:>9.1f}x'
+            )
+            if options['explain']:
+                self.stdout.write(f'  before:\n{indent(before_plan)}')
+                self.stdout.write(f'  after:\n{indent(after_plan)}')
+
+
+def indent(text):
+    return '\n'.join(f'    {line}' for line in text.splitlines())
@@ -0,0 +1,61 @@
+import os
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.tasks.importer import READERS, TaskImporter
+
+
+class Command(BaseCommand):
+    help = 'Imports tasks from a CSV or JSONL file in batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='File to import, "-" for stdin.')
+        parser.add_argument('--format', choices=sorted(READERS))
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument(
+            '--author',
+            help='Username used for rows without an author.',
+        )
+        parser.add_argument(
+            '--create-missing', action='store_true',
+            help='Create unknown statuses and labels instead of '
+                 'rejecting the row.',
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = options['verbosity']
+        path = options['path']
+        export_format = options['format'] or self.guess_format(path)
+        importer = TaskImporter(
+            batch_size=options['batch_size'],
+            default_author=options['author'],
+            create_missing=options['create_missing'],
+        )
+        if options['author'] and options['author'] not in importer.users:
+            raise CommandError(f'Unknown user "{options["author"]}".')
+        stream = sys.stdin if path == '-' else open(
+            path, newline='', encoding='utf-8'
+        )
+        with stream:
+            importer.run(READERS[export_format](stream), self.progress)
+        for line_number, message in importer.errors:
+            self.stderr.write(f'line {line_number}: {message}')
+        self.stdout.write(
+            f'Imported {importer.imported} tasks, '
+            f'{len(importer.errors)} rows rejected, '
+            f'{importer.rate:.0f} rows/sec.'
+        )
+
+    def progress(self, importer):
+        if self.verbosity > 1:
+            self.stdout.write(
+                f'{importer.imported} imported, {importer.rate:.0f} rows/sec'
+            )
+
+    @staticmethod
+    def guess_format(path):
+        extension = os.path.splitext(path)[1].lstrip('.').lower()
+        if extension not in READERS:
+            raise CommandError('Cannot guess the format, use --format.')
+        return extension
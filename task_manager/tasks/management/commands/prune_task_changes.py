@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from task_manager.tasks.changes import prune
+
+
+class Command(BaseCommand):
+    help = (
+        'Deletes task changes older than TASK_CHANGES_RETENTION_DAYS. '
+        'Clients holding older tokens reload their tasks. Run it '
+        'periodically, e.g. daily from cron.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=settings.TASK_CHANGES_RETENTION_DAYS,
+        )
+
+    def handle(self, *args, **options):
+        removed = prune(options['days'])
+        self.stdout.write(f'Removed {removed} task changes.')
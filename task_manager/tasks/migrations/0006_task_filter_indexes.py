@@ -0,0 +1,91 @@
+# Generated by Django 5.0.14 on 2026-10-18 12:13
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def remove_duplicate_links(apps, schema_editor):
+    TaskLabelLinks = apps.get_model('tasks', 'TaskLabelLinks')
+    duplicates = TaskLabelLinks.objects.values('task', 'label').annotate(
+        keep=Min('id'), total=Count('id'),
+    ).filter(total__gt=1)
+    for row in duplicates:
+        TaskLabelLinks.objects.filter(
+            task=row['task'], label=row['label'],
+        ).exclude(id=row['keep']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labels', '0001_initial'),
+        ('statuses', '0001_initial'),
+        ('tasks', '0005_alter_task_executor'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='task',
+            options={'ordering': ['created_at', 'id']},
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='author',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='author', to=settings.AUTH_USER_MODEL, verbose_name='Task author'),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='description',
+            field=models.TextField(blank=True, max_length=1000, null=True, verbose_name='Task description'),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='executor',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='executor', to=settings.AUTH_USER_MODEL, verbose_name='Task executor'),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='status',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, to='statuses.status', verbose_name='Task status'),
+        ),
+        migrations.AlterField(
+            model_name='tasklabellinks',
+            name='label',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, to='labels.label'),
+        ),
+        migrations.AlterField(
+            model_name='tasklabellinks',
+            name='task',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='tasks.task'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['created_at', 'id'], name='task_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status', 'created_at', 'id'], name='task_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['executor', 'created_at', 'id'], name='task_executor_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['author', 'created_at', 'id'], name='task_author_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tasklabellinks',
+            index=models.Index(fields=['task', 'label'], name='task_label_idx'),
+        ),
+        migrations.RunPython(
+            remove_duplicate_links, migrations.RunPython.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='tasklabellinks',
+            constraint=models.UniqueConstraint(fields=('label', 'task'), name='unique_label_task'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.14 on 2026-10-18 12:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from task_manager.tasks.search import (
+    install_search_index, remove_search_index,
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0006_task_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskSearchIndex',
+            fields=[
+                ('task', models.OneToOneField(db_column='rowid', on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_index', serialize=False, to='tasks.task')),
+                ('match', models.TextField(db_column='tasks_task_fts')),
+                ('rank', models.FloatField()),
+            ],
+            options={
+                'db_table': 'tasks_task_fts',
+                'managed': False,
+            },
+        ),
+        migrations.RunPython(install_search_index, remove_search_index),
+    ]
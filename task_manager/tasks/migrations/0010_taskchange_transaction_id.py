@@ -0,0 +1,22 @@
+# Generated by Django 5.0.14 on 2026-10-18 13:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0009_taskchange'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='taskchange',
+            name='transaction_id',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='taskchange',
+            index=models.Index(fields=['transaction_id', 'id'], name='task_change_position_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labels', '0003_reindex_name_lower'),
+        ('tasks', '0010_taskchange_transaction_id'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='labels',
+            field=models.ManyToManyField(blank=True, through='tasks.TaskLabelLinks', through_fields=('task', 'label'), to='labels.label', verbose_name='Task labels'),
+        ),
+    ]
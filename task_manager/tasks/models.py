@@ -6,6 +6,14 @@ from task_manager.texts import create_tasks
 from task_manager.users.models import User
 
 
+class TaskQuerySet(models.QuerySet):
+
+    def with_related(self):
+        return self.select_related(
+            'status', 'author', 'executor'
+        ).prefetch_related('labels')
+
+
 class Task(models.Model):
     name = models.CharField(
         max_length=150,
@@ -23,9 +31,15 @@ class Task(models.Model):
         auto_now_add=True,
         verbose_name=create_tasks['task_date']
     )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        db_index=True,
+        verbose_name=create_tasks['task_updated']
+    )
     author = models.ForeignKey(
         User,
         on_delete=models.PROTECT,
+        db_index=False,
         verbose_name=create_tasks['task_author'],
         related_name='author'
     )
@@ -33,6 +47,7 @@ class Task(models.Model):
         Status,
         blank=False,
         on_delete=models.PROTECT,
+        db_index=False,
         verbose_name=create_tasks['task_status']
     )
     executor = models.ForeignKey(
@@ -40,6 +55,7 @@ class Task(models.Model):
         blank=True,
         null=True,
         on_delete=models.PROTECT,
+        db_index=False,
         verbose_name=create_tasks['task_executor'],
         related_name='executor'
     )
@@ -51,10 +67,81 @@ class Task(models.Model):
         verbose_name=create_tasks['task_labels']
     )
 
+    objects = TaskQuerySet.as_manager()
+
+    class Meta:
+        ordering = ['created_at', 'id']
+        indexes = [
+            models.Index(
+                fields=['created_at', 'id'],
+                name='task_created_idx'
+            ),
+            models.Index(
+                fields=['status', 'created_at', 'id'],
+                name='task_status_created_idx'
+            ),
+            models.Index(
+                fields=['executor', 'created_at', 'id'],
+                name='task_executor_created_idx'
+            ),
+            models.Index(
+                fields=['author', 'created_at', 'id'],
+                name='task_author_created_idx'
+            ),
+        ]
+
     def __str__(self):
         return self.name
 
 
 class TaskLabelLinks(models.Model):
-    task = models.ForeignKey(Task, on_delete=models.CASCADE)
-    label = models.ForeignKey(Label, on_delete=models.PROTECT)
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, db_index=False)
+    label = models.ForeignKey(Label, on_delete=models.PROTECT, db_index=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['task', 'label'], name='task_label_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['label', 'task'],
+                name='unique_label_task'
+            ),
+        ]
+
+
+class TaskSearchIndex(models.Model):
+    task = models.OneToOneField(
+        Task,
+        primary_key=True,
+        on_delete=models.DO_NOTHING,
+        db_column='rowid',
+        related_name='search_index'
+    )
+    match = models.TextField(db_column='tasks_task_fts')
+    rank = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = 'tasks_task_fts'
+
+
+class TaskChange(models.Model):
+    """Ids of created, changed and deleted tasks.
+
+    Changes are read in ``(transaction_id, id)`` order. On PostgreSQL
+    ``transaction_id`` is the id of the writing transaction; SQLite commits
+    one writer at a time in id order and leaves it 0.
+    """
+
+    transaction_id = models.BigIntegerField(default=0)
+    task_id = models.BigIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['transaction_id', 'id'],
+                name='task_change_position_idx'
+            ),
+        ]
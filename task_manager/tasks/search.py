@@ -0,0 +1,141 @@
+import re
+
+from django.db import connections
+from django.db.models import F, Q
+
+TERM = re.compile(r'\w+')
+FTS_TABLE = 'tasks_task_fts'
+POSTGRES_INDEX = 'task_search_idx'
+
+ORDERING = {
+    'sqlite': ('search_rank', 'id'),
+    'postgresql': ('-search_rank', 'id'),
+}
+
+SQLITE_SCHEMA = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "name, description, content='tasks_task', content_rowid='id')",
+)
+SQLITE_TRIGGERS = (
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_insert "
+    "AFTER INSERT ON tasks_task BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, name, description) "
+    "VALUES (new.id, new.name, new.description); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_delete "
+    "AFTER DELETE ON tasks_task BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_update "
+    "AFTER UPDATE OF name, description ON tasks_task BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); "
+    f"INSERT INTO {FTS_TABLE}(rowid, name, description) "
+    "VALUES (new.id, new.name, new.description); END",
+)
+
+
+def search_terms(value):
+    return TERM.findall(value or '')
+
+
+def search(queryset, value):
+    terms = search_terms(value)
+    if not terms:
+        return queryset
+    vendor = connections[queryset.db].vendor
+    return BACKENDS.get(vendor, search_icontains)(queryset, terms)
+
+
+def search_ordering(queryset):
+    return ORDERING.get(connections[queryset.db].vendor)
+
+
+def search_query(terms, prefix, separator):
+    return separator.join(terms[:-1] + [prefix % terms[-1]])
+
+
+def search_sqlite(queryset, terms):
+    terms = [f'"{term}"' for term in terms]
+    return queryset.filter(
+        search_index__match=search_query(terms, '%s*', ' ')
+    ).annotate(search_rank=F('search_index__rank'))
+
+
+def search_postgresql(queryset, terms):
+    from django.contrib.postgres.search import SearchQuery, SearchRank
+
+    query = SearchQuery(
+        search_query(terms, '%s:*', ' & '),
+        search_type='raw',
+        config='simple',
+    )
+    return queryset.alias(search_vector=search_vector()).filter(
+        search_vector=query
+    ).annotate(search_rank=SearchRank(search_vector(), query))
+
+
+def search_icontains(queryset, terms):
+    for term in terms:
+        queryset = queryset.filter(
+            Q(name__icontains=term) | Q(description__icontains=term)
+        )
+    return queryset
+
+
+BACKENDS = {
+    'sqlite': search_sqlite,
+    'postgresql': search_postgresql,
+}
+
+
+def search_vector():
+    from django.contrib.postgres.search import SearchVector
+
+    return SearchVector('name', 'description', config='simple')
+
+
+def search_index():
+    from django.contrib.postgres.indexes import GinIndex
+
+    return GinIndex(search_vector(), name=POSTGRES_INDEX)
+
+
+def install_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        for statement in SQLITE_SCHEMA + SQLITE_TRIGGERS:
+            schema_editor.execute(statement)
+        schema_editor.execute(
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+        )
+    elif vendor == 'postgresql':
+        schema_editor.add_index(
+            apps.get_model('tasks', 'Task'), search_index()
+        )
+
+
+def remove_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        for action in ('insert', 'delete', 'update'):
+            schema_editor.execute(
+                f'DROP TRIGGER IF EXISTS {FTS_TABLE}_{action}'
+            )
+        schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+    elif vendor == 'postgresql':
+        schema_editor.remove_index(
+            apps.get_model('tasks', 'Task'), search_index()
+        )
+
+
+def restore_search_triggers(using, **kwargs):
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = %s", [FTS_TABLE]
+        )
+        if cursor.fetchone():
+            for statement in SQLITE_TRIGGERS:
+                cursor.execute(statement)
@@ -0,0 +1,63 @@
+from functools import reduce
+from operator import or_
+
+from django.db.models import Q
+from django.utils import timezone
+
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.changes import record
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+
+DISPLAYED_FIELDS = {
+    Status: ({'name'}, ('status',)),
+    Label: ({'name'}, ('labels',)),
+    User: ({'first_name', 'last_name'}, ('author', 'executor')),
+}
+
+
+def touch(tasks):
+    task_ids = list(tasks.values_list('pk', flat=True))
+    updated = tasks.update(updated_at=timezone.now())
+    record(task_ids)
+    return updated
+
+
+def touch_labelled_tasks(instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'pre_clear', 'post_clear'):
+        return
+    if not reverse:
+        if action != 'pre_clear':
+            touch(Task.objects.filter(pk=instance.pk))
+    elif action == 'pre_clear':
+        touch(Task.objects.filter(labels=instance))
+    elif pk_set:
+        touch(Task.objects.filter(pk__in=pk_set))
+
+
+def displayed_values(sender, instance):
+    # deferred fields are left out instead of being loaded
+    fields, _ = DISPLAYED_FIELDS[sender]
+    return {
+        field: instance.__dict__[field]
+        for field in fields if field in instance.__dict__
+    }
+
+
+def remember_displayed_values(sender, instance, **kwargs):
+    instance._displayed_values = displayed_values(sender, instance)
+
+
+def touch_displaying_tasks(sender, instance, created, update_fields,
+                           **kwargs):
+    fields, relations = DISPLAYED_FIELDS[sender]
+    if created or update_fields and not fields & set(update_fields):
+        return
+    values = displayed_values(sender, instance)
+    if values == instance._displayed_values:
+        return
+    instance._displayed_values = values
+    touch(Task.objects.filter(
+        reduce(or_, (Q(**{relation: instance}) for relation in relations))
+    ))
@@ -1,11 +1,32 @@
+import csv
+import json
+import os
+import re
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.cache import caches
 from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
-from django.test import TestCase, Client
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, Client, override_settings
+from django.template.loader import render_to_string
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse_lazy
+from django.utils import timezone
 
 from task_manager import texts
 from task_manager.labels.models import Label
+from task_manager.pagination import CappedCountPaginator
+from task_manager.refdata import SNAPSHOT_FIELDS, snapshot
 from task_manager.statuses.models import Status
-from task_manager.tasks.models import Task
+from task_manager.tasks import changes
+from task_manager.tasks.admin import TaskAdmin
+from task_manager.tasks.models import Task, TaskChange
+from task_manager.tasks.search import search_icontains
+from task_manager.tasks.views import TasksListView
 from task_manager.users.models import User
 
 
@@ -22,6 +43,8 @@ class TasksTest(TestCase):
     }
 
     def setUp(self):
+        caches['local'].clear()
+
         self.task1 = Task.objects.get(pk=1)
         self.task2 = Task.objects.get(pk=2)
         self.task3 = Task.objects.get(pk=3)
@@ -71,7 +94,7 @@ class TasksTest(TestCase):
         )
         tasks = response.context['tasks']
 
-        self.assertEqual(tasks.count(), 2)
+        self.assertEqual(len(tasks), 2)
         self.assertIn(self.task1, tasks)
         self.assertIn(self.task3, tasks)
         self.assertNotIn(self.task2, tasks)
@@ -83,7 +106,7 @@ class TasksTest(TestCase):
         )
         tasks = response.context['tasks']
 
-        self.assertEqual(tasks.count(), 2)
+        self.assertEqual(len(tasks), 2)
         self.assertIn(self.task2, tasks)
         self.assertIn(self.task3, tasks)
         self.assertNotIn(self.task1, tasks)
@@ -95,7 +118,7 @@ class TasksTest(TestCase):
         )
         tasks = response.context['tasks']
 
-        self.assertEqual(tasks.count(), 2)
+        self.assertEqual(len(tasks), 2)
         self.assertIn(self.task1, tasks)
         self.assertIn(self.task3, tasks)
         self.assertNotIn(self.task2, tasks)
@@ -104,11 +127,591 @@ class TasksTest(TestCase):
         response = self.client.get(reverse_lazy('tasks'), {'personal': 'on'})
         tasks = response.context['tasks']
 
-        self.assertEqual(tasks.count(), 1)
+        self.assertEqual(len(tasks), 1)
         self.assertIn(self.task3, tasks)
         self.assertNotIn(self.task1, tasks)
         self.assertNotIn(self.task2, tasks)
 
+    @patch.object(TasksListView, 'paginate_by', 2)
+    def test_tasks_pagination(self):
+        response = self.client.get(reverse_lazy('tasks'))
+        page = response.context['page_obj']
+
+        self.assertEqual(list(response.context['tasks']),
+                         [self.task1, self.task2])
+        self.assertTrue(page.has_next())
+        self.assertFalse(page.has_previous())
+
+        response = self.client.get(
+            reverse_lazy('tasks'), {'cursor': page.next_cursor}
+        )
+        page = response.context['page_obj']
+
+        self.assertEqual(list(response.context['tasks']), [self.task3])
+        self.assertFalse(page.has_next())
+        self.assertTrue(page.has_previous())
+
+        response = self.client.get(
+            reverse_lazy('tasks'), {'cursor': page.previous_cursor}
+        )
+
+        self.assertEqual(list(response.context['tasks']),
+                         [self.task1, self.task2])
+        self.assertFalse(response.context['page_obj'].has_previous())
+
+    def create_microsecond_tasks(self, count=6):
+        Task.objects.all().delete()
+        started = timezone.now().replace(microsecond=0)
+        for number in range(count):
+            task = Task.objects.create(
+                name=f'Micro {number}', status=self.status1, author=self.user1
+            )
+            Task.objects.filter(pk=task.pk).update(
+                created_at=started + timedelta(microseconds=1234 * number + 7)
+            )
+        return list(Task.objects.order_by('created_at', 'id').values_list(
+            'pk', flat=True
+        ))
+
+    @patch.object(TasksListView, 'paginate_by', 2)
+    def test_tasks_pagination_microsecond_timestamps(self):
+        ids = self.create_microsecond_tasks()
+        seen, cursor = [], None
+        while True:
+            response = self.client.get(
+                reverse_lazy('tasks'), {'cursor': cursor} if cursor else {}
+            )
+            seen += [task.pk for task in response.context['tasks']]
+            page = response.context['page_obj']
+            if not page.has_next():
+                break
+            cursor = page.next_cursor
+
+        self.assertEqual(seen, ids)
+
+        response = self.client.get(
+            reverse_lazy('tasks'), {'cursor': page.previous_cursor}
+        )
+
+        self.assertEqual(
+            [task.pk for task in response.context['tasks']], ids[2:4]
+        )
+
+    @patch.object(TasksListView, 'paginate_by', 1)
+    def test_tasks_pagination_keeps_filter(self):
+        response = self.client.get(
+            reverse_lazy('tasks'), {'status': self.status2.pk}
+        )
+        page = response.context['page_obj']
+
+        self.assertEqual(list(response.context['tasks']), [self.task1])
+        self.assertContains(response, f'status={self.status2.pk}&amp;cursor=')
+
+        response = self.client.get(
+            reverse_lazy('tasks'),
+            {'status': self.status2.pk, 'cursor': page.next_cursor}
+        )
+
+        self.assertEqual(list(response.context['tasks']), [self.task3])
+        self.assertFalse(response.context['page_obj'].has_next())
+
+    def test_tasks_search(self):
+        response = self.client.get(reverse_lazy('tasks'), {'search': 'mon'})
+
+        self.assertEqual(list(response.context['tasks']),
+                         [self.task1, self.task3])
+
+        response = self.client.get(
+            reverse_lazy('tasks'), {'search': 'best job'}
+        )
+
+        self.assertEqual(list(response.context['tasks']), [self.task2])
+
+    def test_tasks_search_follows_changes(self):
+        Task.objects.filter(pk=self.task2.pk).update(name='Write a report')
+        self.task3.delete()
+
+        response = self.client.get(
+            reverse_lazy('tasks'), {'search': 'report'}
+        )
+        self.assertEqual(list(response.context['tasks']), [self.task2])
+
+        response = self.client.get(reverse_lazy('tasks'), {'search': 'month'})
+        self.assertEqual(list(response.context['tasks']), [])
+
+    @patch.object(TasksListView, 'paginate_by', 1)
+    def test_tasks_search_pagination(self):
+        response = self.client.get(reverse_lazy('tasks'), {'search': 'mon'})
+        page = response.context['page_obj']
+
+        self.assertEqual(list(response.context['tasks']), [self.task1])
+
+        response = self.client.get(
+            reverse_lazy('tasks'), {'search': 'mon', 'cursor': page.next_cursor}
+        )
+
+        self.assertEqual(list(response.context['tasks']), [self.task3])
+        self.assertFalse(response.context['page_obj'].has_next())
+
+    def test_tasks_search_without_terms(self):
+        response = self.client.get(reverse_lazy('tasks'), {'search': '?!'})
+
+        self.assertEqual(len(response.context['tasks']), 3)
+
+    def test_tasks_search_icontains_fallback(self):
+        tasks = search_icontains(Task.objects.all(), ['BEST', 'it'])
+
+        self.assertEqual(list(tasks), [self.task2])
+
+    def test_tasks_bulk_selected(self):
+        response = self.client.post(reverse_lazy('tasks_bulk'), {
+            'tasks': [self.task1.pk, self.task2.pk],
+            'status': self.status1.pk,
+            'executor': self.user1.pk,
+            'add_labels': [self.label1.pk, self.label3.pk],
+            'remove_labels': [self.label2.pk],
+        })
+
+        self.assertRedirects(response, '/tasks/?')
+        for task in Task.objects.filter(pk__in=[self.task1.pk, self.task2.pk]):
+            self.assertEqual(task.status, self.status1)
+            self.assertEqual(task.executor, self.user1)
+            self.assertEqual(set(task.labels.all()), {self.label1, self.label3})
+        self.task3.refresh_from_db()
+        self.assertEqual(self.task3.status, self.status2)
+        self.assertEqual(list(self.task3.labels.all()), [self.label2])
+
+    def test_tasks_bulk_all_matching(self):
+        url = f'{reverse_lazy("tasks_bulk")}?status={self.status2.pk}'
+        for model in SNAPSHOT_FIELDS:
+            snapshot(model)
+        with self.assertNumQueries(9):
+            response = self.client.post(url, {
+                'all_matching': 'on',
+                'status': self.status3.pk,
+                'add_labels': [self.label1.pk],
+            })
+
+        self.assertRedirects(response, f'/tasks/?status={self.status2.pk}')
+        self.assertEqual(
+            set(Task.objects.filter(status=self.status3)),
+            {self.task1, self.task2, self.task3}
+        )
+        self.assertEqual(
+            set(self.label1.task_set.all()), {self.task1, self.task3}
+        )
+
+    def test_tasks_bulk_invalid(self):
+        response = self.client.post(
+            reverse_lazy('tasks_bulk'), {'status': self.status1.pk},
+            follow=True
+        )
+
+        self.assertContains(response, texts.messages['bulk_no_tasks'])
+        self.assertEqual(Task.objects.filter(status=self.status1).count(), 0)
+
+        response = self.client.post(
+            reverse_lazy('tasks_bulk'), {'tasks': [self.task1.pk]},
+            follow=True
+        )
+
+        self.assertContains(response, texts.messages['bulk_no_changes'])
+
+    def test_tasks_invalid_cursor(self):
+        response = self.client.get(reverse_lazy('tasks'), {'cursor': 'oops'})
+
+        self.assertTemplateUsed(response, './errors/error_404.html')
+        self.assertTemplateNotUsed(response, 'tasks/tasks.html')
+
+    def test_tasks_list_queries_do_not_grow_with_rows(self):
+        with CaptureQueriesContext(connection) as before:
+            self.client.get(reverse_lazy('tasks'))
+
+        for number in range(10):
+            task = Task.objects.create(
+                name=f'Extra {number}',
+                description='',
+                status=self.status1,
+                author=self.user3,
+                executor=self.user2,
+            )
+            task.labels.set([self.label1, self.label2])
+
+        with CaptureQueriesContext(connection) as after:
+            response = self.client.get(reverse_lazy('tasks'))
+
+        self.assertEqual(len(response.context['tasks']), 13)
+        self.assertEqual(len(before), len(after))
+        self.assertContains(response, 'Error, Test')
+
+    def test_tasks_list_renders_changed_rows_only(self):
+        url = reverse_lazy('tasks')
+        self.client.get(url)
+
+        with self.assertNumQueries(4), patch(
+            'task_manager.tasks.fragments.render_to_string'
+        ) as render:
+            response = self.client.get(url)
+        render.assert_not_called()
+        self.assertContains(response, self.task1.name)
+
+        self.task2.name = 'Renamed task'
+        self.task2.save()
+        with patch(
+            'task_manager.tasks.fragments.render_to_string',
+            wraps=render_to_string,
+        ) as render:
+            response = self.client.get(url)
+        self.assertEqual(render.call_count, 1)
+        self.assertContains(response, 'Renamed task')
+
+    def test_tasks_list_rows_follow_related_changes(self):
+        url = reverse_lazy('tasks')
+        self.client.get(url)
+
+        self.status2.name = 'Reviewed'
+        self.status2.save()
+        self.label2.name = 'Bug'
+        self.label2.save()
+        response = self.client.get(url)
+
+        self.assertContains(response, '<td>Reviewed</td>', count=2)
+        self.assertContains(response, 'Bug', count=2)
+
+    def test_tasks_list_rows_per_language(self):
+        url = reverse_lazy('tasks')
+        self.client.get(url, HTTP_ACCEPT_LANGUAGE='ru')
+        response = self.client.get(url, HTTP_ACCEPT_LANGUAGE='en')
+
+        self.assertContains(response, '>Update</a>', count=3)
+
+    def test_task_detail_queries(self):
+        url = reverse_lazy('task_detail', args=[self.task1.pk])
+        self.client.get(url)
+
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+
+        self.assertContains(response, self.label2.name)
+        self.assertContains(response, self.label3.name)
+
+    def test_task_detail_not_modified(self):
+        url = reverse_lazy('task_detail', args=[self.task1.pk])
+        response = self.client.get(url)
+        etag = response['ETag']
+
+        self.assertIn('private', response['Cache-Control'])
+        self.assertIn('Last-Modified', response)
+
+        with self.assertNumQueries(3):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.task1.labels.remove(self.label2)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_tasks_list_not_modified(self):
+        url = reverse_lazy('tasks')
+        etag = self.client.get(url, {'status': self.status2.pk})['ETag']
+
+        response = self.client.get(
+            url, {'status': self.status2.pk}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 304)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+        self.task3.delete()
+        response = self.client.get(
+            url, {'status': self.status2.pk}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_tasks_list_fragment(self):
+        url = reverse_lazy('tasks')
+        self.client.get(url, {'status': self.status2.pk})
+        with CaptureQueriesContext(connection) as full_queries:
+            full = self.client.get(url, {'status': self.status2.pk})
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                url, {'status': self.status2.pk}, HTTP_X_FRAGMENT='table'
+            )
+
+        self.assertTemplateUsed(response, 'tasks/task_table.html')
+        self.assertTemplateNotUsed(response, 'layout/base.html')
+        self.assertContains(response, self.task1.name)
+        self.assertNotContains(response, self.task2.name)
+        self.assertNotContains(response, '<form')
+        self.assertLess(len(response.content), len(full.content))
+        self.assertLessEqual(len(queries), len(full_queries))
+        self.assertIn('X-Fragment', response['Vary'])
+        self.assertNotEqual(response['ETag'], full['ETag'])
+
+    def test_tasks_list_fragment_load_more(self):
+        ids = self.create_microsecond_tasks(count=3)
+        url = reverse_lazy('tasks')
+        with patch.object(TasksListView, 'paginate_by', 2):
+            first = self.client.get(url, HTTP_X_FRAGMENT='table')
+            page = first.context['page_obj']
+            second = self.client.get(
+                url, {'cursor': page.next_cursor}, HTTP_X_FRAGMENT='table'
+            )
+        first_ids, second_ids = (
+            re.findall(r'name="tasks" value="(\d+)"', response.content.decode())
+            for response in (first, second)
+        )
+
+        self.assertContains(first, 'data-load-more')
+        self.assertNotContains(second, 'data-load-more')
+        self.assertFalse(set(first_ids) & set(second_ids))
+        self.assertEqual([int(pk) for pk in first_ids + second_ids], ids)
+
+    def test_tasks_list_revalidation_does_not_scan_filter(self):
+        url = reverse_lazy('tasks')
+        etag = self.client.get(url, {'status': self.status2.pk})['ETag']
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                url, {'status': self.status2.pk}, HTTP_IF_NONE_MATCH=etag
+            )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse(any(
+            'COUNT(' in query['sql'] or '"tasks_task"' in query['sql']
+            for query in queries
+        ))
+
+    def test_tasks_list_modified_behind_running_transaction(self):
+        url = reverse_lazy('tasks')
+        oldest_running = changes.OLDEST_RUNNING_TRANSACTION
+        with patch.dict(oldest_running, {'sqlite': 'SELECT 9'}):
+            TaskChange.objects.create(transaction_id=10, task_id=self.task1.pk)
+            etag = self.client.get(url)['ETag']
+            # transaction 9 is still running and holds the settled position
+            TaskChange.objects.create(transaction_id=9, task_id=self.task2.pk)
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_tasks_list_not_modified_without_change_log(self):
+        TaskChange.objects.all().delete()
+        url = reverse_lazy('tasks')
+        etag = self.client.get(url)['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        Task.objects.filter(pk=self.task1.pk).update(
+            updated_at=timezone.now() + timedelta(seconds=1)
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_tasks_list_modified_by_related_changes(self):
+        url = reverse_lazy('tasks')
+        etag = self.client.get(url)['ETag']
+
+        self.status2.name = 'Review'
+        self.status2.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Review')
+
+        etag = response['ETag']
+        self.label1.task_set.add(self.task2)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_unchanged_related_save_does_not_touch_tasks(self):
+        changes_count = TaskChange.objects.count()
+        self.user2.set_password('secret')
+        with CaptureQueriesContext(connection) as queries:
+            self.user2.save()
+            self.status2.save()
+            Status.objects.get(pk=self.status2.pk).save()
+
+        self.assertEqual(TaskChange.objects.count(), changes_count)
+        self.assertFalse(any(
+            '"tasks_task"' in query['sql'] for query in queries
+        ))
+
+    def test_tasks_list_with_messages_is_not_cached(self):
+        url = reverse_lazy('tasks')
+        etag = self.client.get(url)['ETag']
+        self.client.post(reverse_lazy('tasks_bulk'), {})
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('ETag', response)
+
+    def test_tasks_export_csv(self):
+        response = self.client.get(
+            reverse_lazy('tasks_export'), {'status': self.status2.pk}
+        )
+        content = b''.join(response.streaming_content).decode()
+        rows = list(csv.DictReader(StringIO(content)))
+
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertEqual([row['name'] for row in rows],
+                         [self.task1.name, self.task3.name])
+        self.assertEqual(rows[0]['labels'], 'Test;Success')
+        self.assertEqual(rows[0]['author'], self.user2.username)
+
+    def test_tasks_export_jsonl(self):
+        response = self.client.get(
+            reverse_lazy('tasks_export'),
+            {'format': 'jsonl', 'personal': 'on'}
+        )
+        content = b''.join(response.streaming_content).decode()
+        rows = [json.loads(line) for line in content.splitlines()]
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['id'], self.task3.pk)
+        self.assertEqual(rows[0]['labels'], [self.label2.name])
+
+    def test_tasks_export_unknown_format(self):
+        response = self.client.get(
+            reverse_lazy('tasks_export'), {'format': 'xml'}
+        )
+
+        self.assertTemplateUsed(response, './errors/error_404.html')
+
+    def get_changes(self, **params):
+        return self.client.get(reverse_lazy('tasks_changes'), params).json()
+
+    def test_tasks_changes(self):
+        token = self.get_changes()['token']
+        created = Task.objects.create(
+            name='Synced', status=self.status1, author=self.user1
+        )
+        self.task1.labels.remove(self.label2)
+        Task.objects.filter(pk=self.task2.pk).get().delete()
+
+        changes = self.get_changes(since=token)
+
+        self.assertFalse(changes['reset'])
+        self.assertFalse(changes['more'])
+        self.assertEqual(
+            [row['id'] for row in changes['changed']],
+            [self.task1.pk, created.pk]
+        )
+        self.assertEqual(changes['changed'][0]['labels'], [self.label3.name])
+        self.assertEqual(changes['deleted'], [self.task2.pk])
+        self.assertEqual(
+            self.get_changes(since=changes['token'])['changed'], []
+        )
+
+    def test_tasks_changes_follow_bulk_and_related_changes(self):
+        token = self.get_changes()['token']
+        self.client.post(reverse_lazy('tasks_bulk'), {
+            'tasks': [self.task1.pk], 'status': self.status1.pk,
+        })
+        self.status3.name = 'Changed'
+        self.status3.save()
+
+        changes = self.get_changes(since=token)
+
+        self.assertEqual(
+            {row['id'] for row in changes['changed']},
+            {self.task1.pk, self.task2.pk}
+        )
+
+    def test_tasks_changes_limit(self):
+        token = self.get_changes()['token']
+        for task in (self.task1, self.task2, self.task3):
+            task.save()
+
+        first = self.get_changes(since=token, limit=2)
+        second = self.get_changes(since=first['token'], limit=2)
+
+        self.assertTrue(first['more'])
+        self.assertEqual(len(first['changed']), 2)
+        self.assertFalse(second['more'])
+        self.assertEqual(second['changed'][0]['id'], self.task3.pk)
+
+    def test_tasks_changes_queries_do_not_grow_with_tasks(self):
+        token = self.get_changes()['token']
+        self.task1.save()
+        with CaptureQueriesContext(connection) as before:
+            self.get_changes(since=token)
+
+        for number in range(10):
+            Task.objects.create(
+                name=f'Extra {number}', status=self.status1, author=self.user1
+            )
+        token = self.get_changes()['token']
+        self.task1.save()
+        with CaptureQueriesContext(connection) as after:
+            self.get_changes(since=token)
+
+        self.assertEqual(len(before), len(after))
+
+    def test_tasks_changes_wait_for_older_transactions(self):
+        token = self.get_changes()['token']
+        oldest_running = changes.OLDEST_RUNNING_TRANSACTION
+        with patch.dict(oldest_running, {'sqlite': 'SELECT 9'}):
+            TaskChange.objects.create(transaction_id=10, task_id=self.task1.pk)
+            TaskChange.objects.create(transaction_id=8, task_id=self.task2.pk)
+            first = self.get_changes(since=token)
+            # transaction 9 commits after the poll with a higher id
+            TaskChange.objects.create(transaction_id=9, task_id=self.task3.pk)
+            oldest_running['sqlite'] = 'SELECT 11'
+            second = self.get_changes(since=first['token'])
+
+        self.assertEqual(
+            [row['id'] for row in first['changed']], [self.task2.pk]
+        )
+        self.assertEqual(
+            [row['id'] for row in second['changed']],
+            [self.task1.pk, self.task3.pk]
+        )
+
+    def test_tasks_changes_record_transaction_id(self):
+        with patch.dict(changes.TRANSACTION_ID, {'sqlite': 'SELECT 42'}):
+            self.task1.save()
+
+        self.assertEqual(
+            TaskChange.objects.latest('pk').transaction_id, 42
+        )
+
+    def test_tasks_changes_pruned_token(self):
+        token = self.get_changes()['token']
+        self.task1.save()
+        self.task2.save()
+        call_command('prune_task_changes', days=0, stdout=StringIO())
+
+        self.assertTrue(self.get_changes(since=token)['reset'])
+
+    def test_tasks_changes_requires_auth(self):
+        self.client.logout()
+        url = reverse_lazy('tasks_changes')
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertIn('error', response.json())
+        with override_settings(API_TOKEN='secret'):
+            response = self.client.get(
+                url, HTTP_AUTHORIZATION='Bearer secret'
+            )
+            export = self.client.get(
+                reverse_lazy('tasks_export'), {'format': 'jsonl'},
+                HTTP_AUTHORIZATION='Bearer secret'
+            )
+        self.assertTrue(response.json()['reset'])
+        self.assertEqual(export.status_code, 200)
+
+    def test_tasks_changes_invalid_token(self):
+        response = self.client.get(
+            reverse_lazy('tasks_changes'), {'since': 'oops'}
+        )
+
+        self.assertTemplateUsed(response, './errors/error_404.html')
+
     def test_task_detai(self):
         response = self.client.get(
             reverse_lazy('task_detail', args=[self.task2.pk])
@@ -208,3 +811,176 @@ class TasksTest(TestCase):
             expected_exception=PermissionDenied,
             expected_message=texts.messages['no_rights']
         )
+
+    def test_task_delete_queries(self):
+        url = reverse_lazy('task_delete', args=[self.task3.id])
+        with self.assertNumQueries(3):
+            self.client.get(url)
+        with self.assertNumQueries(3):
+            self.client.post(reverse_lazy('task_delete', args=[self.task1.id]))
+        with self.assertNumQueries(6):
+            response = self.client.post(url)
+
+        self.assertRedirects(response, reverse_lazy('tasks'))
+
+    def test_bench_task_indexes(self):
+        out = StringIO()
+        call_command(
+            'bench_task_indexes', tasks=30, users=5, labels=4, repeat=2,
+            stdout=out,
+        )
+
+        self.assertIn('status + label deep', out.getvalue())
+        self.assertEqual(Task.objects.count(), 33)
+        self.assertEqual(
+            Task.objects.filter(status=self.status2).first(), self.task1
+        )
+
+    def import_tasks(self, content, suffix, **options):
+        with tempfile.NamedTemporaryFile(
+            'w', suffix=suffix, delete=False, encoding='utf-8'
+        ) as file:
+            file.write(content)
+        self.addCleanup(os.remove, file.name)
+        out, err = StringIO(), StringIO()
+        call_command(
+            'import_tasks', file.name, stdout=out, stderr=err, **options
+        )
+        return out.getvalue(), err.getvalue()
+
+    def test_import_tasks_csv(self):
+        out, err = self.import_tasks(
+            'name,description,status,author,executor,labels\n'
+            'Imported one,First,Process,Abel,Fermat,Test;Success\n'
+            'Imported two,,Start,,,\n'
+            'Imported three,,Unknown,Abel,,\n'
+            'Build monument,,Start,Abel,,\n'
+            'Imported one,,Start,Abel,,\n',
+            '.csv', author='Galois', batch_size=2,
+        )
+        task = Task.objects.get(name='Imported one')
+
+        self.assertIn('Imported 2 tasks, 3 rows rejected', out)
+        self.assertIn('line 4: unknown status "Unknown"', err)
+        self.assertIn('line 5: task "Build monument" already exists', err)
+        self.assertIn('line 6: task "Imported one" is repeated', err)
+        self.assertEqual(task.author, self.user2)
+        self.assertEqual(task.executor, self.user3)
+        self.assertEqual(set(task.labels.all()), {self.label2, self.label3})
+        self.assertEqual(
+            Task.objects.get(name='Imported two').author, self.user1
+        )
+
+    def test_import_tasks_jsonl(self):
+        out, err = self.import_tasks(
+            '{"name": "From json", "status": "Finish", "author": "Abel", '
+            '"labels": ["New label"]}\n'
+            'not json\n',
+            '.jsonl', create_missing=True,
+        )
+
+        self.assertIn('Imported 1 tasks, 1 rows rejected', out)
+        self.assertIn('line 2: invalid JSON', err)
+        self.assertEqual(
+            list(Task.objects.get(name='From json').labels.values_list(
+                'name', flat=True
+            )),
+            ['New label']
+        )
+
+    def test_export_import_round_trip(self):
+        response = self.client.get(reverse_lazy('tasks_export'))
+        content = b''.join(response.streaming_content).decode()
+        Task.objects.all().delete()
+
+        out, err = self.import_tasks(content, '.csv')
+
+        self.assertEqual(err, '')
+        self.assertEqual(Task.objects.count(), 3)
+        self.assertEqual(
+            set(Task.objects.get(name=self.task1.name).labels.all()),
+            {self.label2, self.label3}
+        )
+
+
+@override_settings(
+    STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage'
+)
+class TaskAdminTest(TestCase):
+
+    fixtures = ['tasks.json', 'labels.json', 'statuses.json', 'users.json']
+
+    def setUp(self):
+        caches['local'].clear()
+        self.client.force_login(
+            User.objects.create_superuser('admin', password='admin')
+        )
+        self.url = reverse_lazy('admin:tasks_task_changelist')
+
+    def test_changelist_queries_do_not_grow_with_tasks(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(7):
+            self.client.get(self.url)
+        Task.objects.bulk_create(
+            Task(name=f'Extra {number}', author_id=1, status_id=1)
+            for number in range(30)
+        )
+
+        with self.assertNumQueries(7):
+            response = self.client.get(self.url)
+
+        self.assertContains(response, 'Extra 29')
+
+    def test_changelist_pages_past_count_cap(self):
+        with patch.object(CappedCountPaginator, 'max_count', 2), \
+                patch.object(TaskAdmin, 'list_per_page', 1):
+            first = self.client.get(self.url)
+            last = self.client.get(self.url, {'p': 3})
+
+        self.assertContains(first, '2+ tasks')
+        self.assertEqual(last.status_code, 200)
+        self.assertEqual(len(last.context['cl'].result_list), 1)
+        self.assertContains(last, '3 tasks')
+
+    def test_changelist_search(self):
+        response = self.client.get(self.url, {'q': 'monum'})
+
+        self.assertEqual(
+            [task.name for task in response.context['cl'].result_list],
+            ['Build monument']
+        )
+
+    def test_set_status_action(self):
+        response = self.client.post(self.url, {
+            'action': 'set_status_3',
+            '_selected_action': [1, 3],
+        }, follow=True)
+
+        self.assertEqual(
+            list(Task.objects.filter(status_id=3).values_list('pk', flat=True)),
+            [1, 2, 3]
+        )
+        self.assertContains(response, texts.messages['tasks_bulk_changed'] % {
+            'count': 2,
+        })
+
+    def test_delete_tasks_action(self):
+        last_change = TaskChange.objects.latest('pk').pk
+        response = self.client.post(self.url, {
+            'action': 'delete_tasks',
+            '_selected_action': [1, 3],
+        }, follow=True)
+
+        self.assertEqual(
+            list(Task.objects.values_list('pk', flat=True)), [2]
+        )
+        self.assertEqual(
+            set(TaskChange.objects.filter(pk__gt=last_change).values_list(
+                'task_id', flat=True
+            )),
+            {1, 3}
+        )
+        self.assertContains(response, texts.messages['tasks_bulk_deleted'] % {
+            'count': 2,
+        })
+        self.assertNotContains(response, 'value="delete_selected"')
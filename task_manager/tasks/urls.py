@@ -1,10 +1,22 @@
 from django.urls import path
 
+from task_manager.async_views import select_view
 from task_manager.tasks import views
 
 urlpatterns = [
-    path('', views.TasksListView.as_view(), name='tasks'),
-    path('<int:pk>/', views.TaskView.as_view(), name='task_detail'),
+    path(
+        '',
+        select_view(views.TasksListView, views.AsyncTasksListView).as_view(),
+        name='tasks'
+    ),
+    path('export/', views.TasksExportView.as_view(), name='tasks_export'),
+    path('changes/', views.TaskChangesView.as_view(), name='tasks_changes'),
+    path('bulk/', views.TasksBulkView.as_view(), name='tasks_bulk'),
+    path(
+        '<int:pk>/',
+        select_view(views.TaskView, views.AsyncTaskView).as_view(),
+        name='task_detail'
+    ),
     path('create/', views.TaskCreateView.as_view(), name='task_create'),
     path(
         '<int:pk>/update/',
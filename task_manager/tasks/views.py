@@ -1,30 +1,237 @@
+from asgiref.sync import sync_to_async
+from django.contrib import messages
 from django.contrib.messages.views import SuccessMessageMixin
-from django.urls import reverse_lazy
+from django.db.models import Count, Max
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.shortcuts import redirect
+from django.urls import reverse, reverse_lazy
+from django.utils.cache import patch_vary_headers
+from django.views import View
 from django.views.generic import CreateView, DetailView, UpdateView, DeleteView
-from django_filters.views import FilterView
+from django_filters.views import FilterMixin, FilterView
 
 from task_manager import texts
-from task_manager.mixins import AuthCheckMixin, AuthorCheckMixin
+from task_manager.async_views import AsyncDetailView, AsyncListView
+from task_manager.mixins import (
+    ApiAuthMixin, AsyncAuthCheckMixin, AsyncConditionalGetMixin,
+    AuthCheckMixin, AuthorCheckMixin, ConditionalGetMixin, ReplicaReadMixin,
+)
+from task_manager.pagination import InvalidCursor, KeysetPaginationMixin
+from task_manager.tasks import changes
+from task_manager.tasks.bulk import bulk_change
+from task_manager.tasks.export import FORMATS, export_rows
 from task_manager.tasks.filters import TaskFilter
-from task_manager.tasks.forms import TaskForm
+from task_manager.tasks.forms import TaskBulkForm, TaskForm
+from task_manager.tasks.fragments import ROW_KEY_FIELDS, render_rows
 from task_manager.tasks.models import Task
+from task_manager.tasks.search import search_ordering
 from task_manager.users.models import User
 
 
-class TasksListView(AuthCheckMixin, FilterView):
+class TasksListMixin(ReplicaReadMixin, KeysetPaginationMixin):
+    """Task list, or only its table when requested with ``X-Fragment``."""
+
     template_name = 'tasks/tasks.html'
+    fragment_template_name = 'tasks/task_table.html'
+    fragment_header = 'X-Fragment'
     model = Task
     filterset_class = TaskFilter
     context_object_name = 'tasks'
+    cursor_ordering = ('created_at', 'id')
 
     extra_context = {
         'basic': texts.basic,
         'texts': texts.create_tasks,
-        'button_text': texts.buttons['demonstrate']
+        'pagination': texts.pagination,
+        'button_text': texts.buttons['demonstrate'],
+        'bulk_button_text': texts.buttons['bulk_apply'],
     }
 
+    def get_queryset(self):
+        return Task.objects.only(*ROW_KEY_FIELDS)
+
+    def is_fragment(self):
+        return self.request.headers.get(self.fragment_header) == 'table'
+
+    def get_template_names(self):
+        if self.is_fragment():
+            return [self.fragment_template_name]
+        return super().get_template_names()
+
+    def render_to_response(self, context, **response_kwargs):
+        response = super().render_to_response(context, **response_kwargs)
+        patch_vary_headers(response, [self.fragment_header])
+        return response
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        if not self.is_fragment():
+            context['bulk_form'] = TaskBulkForm()
+        if 'task_rows' not in context:
+            context['task_rows'] = render_rows(context['tasks'])
+        return context
+
+    def get_validators(self):
+        filterset = self.get_filterset(self.get_filterset_class())
+        if filterset.is_bound and not filterset.is_valid():
+            return None
+        state = changes.change_state()
+        if state is None:
+            state = self.filter_state(filterset)
+        return self.list_validators(state)
+
+    def filter_state(self, filterset):
+        # before the first change is logged
+        state = filterset.qs.order_by().aggregate(
+            last_modified=Max('updated_at'), count=Count('pk')
+        )
+        return state['last_modified'], state['count']
+
+    def list_validators(self, state):
+        # every change of a task, its labels or their displayed names and
+        # every deletion moves the change log, so the filter is not counted
+        last_modified, state = state
+        return last_modified, (
+            self.request.GET.urlencode(), state, self.is_fragment()
+        )
+
+    def get_cursor_ordering(self):
+        if 'search_rank' in self.object_list.query.annotations:
+            return search_ordering(self.object_list)
+        return self.cursor_ordering
+
+
+class TasksListView(
+    AuthCheckMixin,
+    TasksListMixin,
+    ConditionalGetMixin,
+    FilterView
+):
+    pass
+
+
+class AsyncTasksListView(
+    AsyncAuthCheckMixin,
+    TasksListMixin,
+    AsyncConditionalGetMixin,
+    FilterMixin,
+    AsyncListView
+):
+    filterset = None
+
+    async def aget_filterset(self):
+        if self.filterset is None:
+            filterset = self.get_filterset(self.get_filterset_class())
+            await sync_to_async(filterset.is_valid)()
+            self.filterset = filterset
+        return self.filterset
+
+    async def aget_validators(self):
+        filterset = await self.aget_filterset()
+        if filterset.is_bound and not filterset.is_valid():
+            return None
+        state = await sync_to_async(changes.change_state)()
+        if state is None:
+            state = await sync_to_async(self.filter_state)(filterset)
+        return self.list_validators(state)
+
+    async def aget_object_list(self, queryset):
+        filterset = await self.aget_filterset()
+        if not filterset.is_bound or filterset.is_valid() \
+                or not self.get_strict():
+            queryset = filterset.qs
+        else:
+            queryset = filterset.queryset.none()
+        return await super().aget_object_list(queryset)
+
+    async def aget_context_data(self, **kwargs):
+        task_rows = await sync_to_async(render_rows)(self.object_list)
+        return await super().aget_context_data(
+            filter=self.filterset, task_rows=task_rows, **kwargs
+        )
+
+
+class TasksExportView(ApiAuthMixin, ReplicaReadMixin, View):
 
-class TaskView(AuthCheckMixin, DetailView):
+    def get(self, request, *args, **kwargs):
+        export_format = request.GET.get('format', 'csv')
+        if export_format not in FORMATS:
+            raise Http404('Unknown export format')
+        stream, content_type = FORMATS[export_format]
+        filterset = TaskFilter(
+            request.GET, queryset=Task.objects.all(), request=request
+        )
+        queryset = filterset.qs if filterset.is_valid() else Task.objects.none()
+        response = StreamingHttpResponse(
+            stream(export_rows(queryset)), content_type=content_type
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="tasks.{export_format}"'
+        )
+        return response
+
+
+class TaskChangesView(ApiAuthMixin, View):
+    """Tasks created, changed or deleted since the ``since`` token.
+
+    Without a token, or with one older than the change log, the response
+    has ``reset`` set and clients reload the tasks from the JSONL export.
+    """
+
+    max_limit = changes.LIMIT
+
+    def get(self, request, *args, **kwargs):
+        token = request.GET.get('since')
+        if not token:
+            return JsonResponse(changes.reset())
+        try:
+            position = changes.decode_token(token)
+        except InvalidCursor:
+            raise Http404('Invalid token')
+        if changes.is_pruned(position):
+            return JsonResponse(changes.reset())
+        return JsonResponse(changes.changes_since(position, self.get_limit()))
+
+    def get_limit(self):
+        try:
+            limit = int(self.request.GET.get('limit', self.max_limit))
+        except ValueError:
+            return self.max_limit
+        return min(max(limit, 1), self.max_limit)
+
+
+class TasksBulkView(AuthCheckMixin, View):
+
+    def post(self, request, *args, **kwargs):
+        form = TaskBulkForm(request.POST)
+        if form.is_valid():
+            count = bulk_change(
+                self.get_queryset(form),
+                status=form.cleaned_data['status'],
+                executor=form.cleaned_data['executor'],
+                add_labels=form.cleaned_data['add_labels'],
+                remove_labels=form.cleaned_data['remove_labels'],
+            )
+            messages.success(
+                request, texts.messages['tasks_bulk_changed'] % {
+                    'count': count,
+                }
+            )
+        else:
+            for error in form.non_field_errors():
+                messages.error(request, error)
+        return redirect(f'{reverse("tasks")}?{request.GET.urlencode()}')
+
+    def get_queryset(self, form):
+        if not form.cleaned_data['all_matching']:
+            return form.cleaned_data['tasks']
+        filterset = TaskFilter(
+            self.request.GET, queryset=Task.objects.all(), request=self.request
+        )
+        return filterset.qs if filterset.is_valid() else Task.objects.none()
+
+
+class TaskDetailMixin(ReplicaReadMixin):
     template_name = 'tasks/task_detail.html'
     model = Task
     context_object_name = 'task'
@@ -33,6 +240,43 @@ class TaskView(AuthCheckMixin, DetailView):
         'texts': texts.create_tasks,
     }
 
+    def get_queryset(self):
+        return Task.objects.with_related()
+
+    def get_validators(self):
+        return self.detail_validators(self.get_last_modified().first())
+
+    async def aget_validators(self):
+        return self.detail_validators(await self.get_last_modified().afirst())
+
+    def get_last_modified(self):
+        return Task.objects.filter(pk=self.kwargs['pk']).values_list(
+            'updated_at', flat=True
+        )
+
+    def detail_validators(self, last_modified):
+        if last_modified is None:
+            return None
+        return last_modified, self.kwargs['pk']
+
+
+class TaskView(
+    AuthCheckMixin,
+    TaskDetailMixin,
+    ConditionalGetMixin,
+    DetailView
+):
+    pass
+
+
+class AsyncTaskView(
+    AsyncAuthCheckMixin,
+    TaskDetailMixin,
+    AsyncConditionalGetMixin,
+    AsyncDetailView
+):
+    pass
+
 
 class TaskCreateView(AuthCheckMixin, SuccessMessageMixin, CreateView):
     template_name = 'form.html'
@@ -95,5 +339,5 @@ class TaskDeleteView(
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['delete_obj'] = self.get_object().name
+        context['delete_obj'] = self.object.name
         return context
@@ -35,6 +35,13 @@ buttons = {
     'create_status': _('Create status button'),
     'create_label': _('Create label button'),
     'demonstrate': _('Demonstrate'),
+    'bulk_apply': _('Apply bulk change'),
+}
+
+pagination = {
+    'next_page': _('Next page'),
+    'previous_page': _('Previous page'),
+    'load_more': _('Load more'),
 }
 
 users_list = {
@@ -42,7 +49,9 @@ users_list = {
     'id': _('ID'),
     'user_name': _('Using name'),
     'full_name': _('Full name'),
+    'tasks': _('Tasks'),
     'date_joined': _('Date joined'),
+    'search': _('User search'),
     'update': _('Update'),
     'delete': _('Delete'),
 }
@@ -63,6 +72,7 @@ create_status = {
     'status_title': _('Status title'),
     'status_create': _('Create status'),
     'status_id': _('Status ID'),
+    'status_tasks': _('Tasks'),
     'status_date': _('Status date'),
     'status_update': _('Update status'),
     'status_delete': _('Delete status'),
@@ -76,6 +86,7 @@ create_label = {
     'label_title': _('Label title'),
     'label_create': _('Create label'),
     'label_id': _('Status ID'),
+    'label_tasks': _('Tasks'),
     'label_date': _('Status date'),
     'label_update': _('Update'),
     'label_delete': _('Delete'),
@@ -88,6 +99,7 @@ create_tasks = {
     'task_name': _('Status name'),
     'task_description': _('Task description'),
     'task_date': _('Task date'),
+    'task_updated': _('Task updated'),
     'tasks_title': _('Task title'),
     'task_create': _('Create task'),
     'task_label': _('Task label'),
@@ -103,6 +115,15 @@ create_tasks = {
     'task_detail_cancel': _('Task detail cancel'),
     'task_update_title': _('Task update title'),
     'task_delete_title': _('Task delete title'),
+    'export_csv': _('Export CSV'),
+    'export_jsonl': _('Export JSONL'),
+    'task_search': _('Task search'),
+    'bulk_title': _('Bulk change'),
+    'bulk_all_matching': _('All matching tasks'),
+    'bulk_status': _('New status'),
+    'bulk_executor': _('New executor'),
+    'bulk_add_labels': _('Add labels'),
+    'bulk_remove_labels': _('Remove labels'),
 }
 
 messages = {
@@ -126,6 +147,13 @@ messages = {
     'task_changed': _('Task changed'),
     'protected_task': _('No delete task'),
     'task_deleted': _('Task deleted'),
+    'tasks_bulk_changed': _('Tasks bulk changed'),
+    'tasks_bulk_deleted': _('Tasks bulk deleted'),
+    'bulk_no_tasks': _('Bulk no tasks'),
+    'bulk_no_changes': _('Bulk no changes'),
+    'admin_set_status': _('Admin set status'),
+    'admin_assign_to_me': _('Admin assign to me'),
+    'admin_delete_tasks': _('Admin delete tasks'),
 }
 
 errors = {
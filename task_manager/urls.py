@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.urls import path, include
 
-from task_manager import views
+from task_manager import api, autocomplete, views
 
 urlpatterns = [
     path(
@@ -16,6 +16,26 @@ urlpatterns = [
     path('statuses/', include('task_manager.statuses.urls')),
     path('tasks/', include('task_manager.tasks.urls')),
     path('labels/', include('task_manager.labels.urls')),
+    path(
+        'autocomplete/users/',
+        autocomplete.UserAutocompleteView.as_view(),
+        name='autocomplete_users'
+    ),
+    path(
+        'autocomplete/statuses/',
+        autocomplete.StatusAutocompleteView.as_view(),
+        name='autocomplete_statuses'
+    ),
+    path(
+        'autocomplete/labels/',
+        autocomplete.LabelAutocompleteView.as_view(),
+        name='autocomplete_labels'
+    ),
+    path('api/tasks/', api.TasksApiView.as_view(), name='api_tasks'),
+    path('api/statuses/', api.StatusesApiView.as_view(), name='api_statuses'),
+    path('api/labels/', api.LabelsApiView.as_view(), name='api_labels'),
+    path('api/users/', api.UsersApiView.as_view(), name='api_users'),
+    path('metrics/', views.MetricsView.as_view(), name='metrics'),
     path('panel/', admin.site.urls),
 ]
 
@@ -1,5 +1,18 @@
 from django.contrib import admin
 
+from task_manager.autocomplete import prefix_search
+from task_manager.pagination import CappedCountAdminMixin
 from task_manager.users.models import User
 
-admin.site.register(User)
+
+@admin.register(User)
+class UserAdmin(CappedCountAdminMixin, admin.ModelAdmin):
+    list_display = ('username', 'first_name', 'last_name', 'is_staff')
+    list_filter = ('is_staff', 'is_active')
+    search_fields = ('first_name', 'last_name', 'username')
+    filter_horizontal = ('groups', 'user_permissions')
+
+    def get_search_results(self, request, queryset, search_term):
+        return prefix_search(
+            queryset, self.search_fields, search_term, words=True
+        ), False
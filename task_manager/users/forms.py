@@ -27,3 +27,11 @@ class UserForm(UserCreationForm):
 class UpdateUserForm(UserForm):
     def clean_username(self):
         return self.cleaned_data.get("username")
+
+    def save(self, commit=True):
+        user = super().save(commit=False)
+        if commit:
+            user.save(update_fields=(
+                'first_name', 'last_name', 'username', 'password'
+            ))
+        return user
@@ -0,0 +1,26 @@
+from django.db import migrations
+
+INDEXES = (
+    'user_first_name_lower_idx',
+    'user_last_name_lower_idx',
+    'user_username_lower_idx',
+)
+
+
+def reindex(apps, schema_editor):
+    # built with SQLite's ASCII-only LOWER() before it was replaced
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for index in INDEXES:
+        schema_editor.execute(f'REINDEX {index}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_name_lower_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(reindex, migrations.RunPython.noop),
+    ]
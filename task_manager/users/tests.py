@@ -1,10 +1,15 @@
+from unittest.mock import patch
+
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models.deletion import ProtectedError
-from django.test import TestCase, Client
+from django.db.models.deletion import Collector, ProtectedError
+from django.contrib.messages import get_messages
+from django.test import TestCase, Client, override_settings
 from django.urls import reverse_lazy
 
 from task_manager import texts
+from task_manager.tasks.models import TaskChange
 from task_manager.users.models import User
+from task_manager.users.views import UsersListView
 
 
 class UsersTest(TestCase):
@@ -111,6 +116,31 @@ class UsersTest(TestCase):
         self.assertEqual(updated_user.first_name, params['first_name'])
         self.assertEqual(updated_user.last_name, params['last_name'])
 
+    def test_user_update_post_saves_form_fields(self):
+        self.client.force_login(self.user2)
+        params = {
+            'username': self.user2.username,
+            'first_name': self.user2.first_name,
+            'last_name': self.user2.last_name,
+            'password1': 'secret',
+            'password2': 'secret',
+        }
+        changes_count = TaskChange.objects.count()
+        with patch.object(User, 'save', autospec=True,
+                          side_effect=User.save) as save:
+            self.client.post(
+                reverse_lazy('user_update', args=[self.user2.id]), data=params
+            )
+
+        self.assertEqual(
+            set(save.call_args.kwargs['update_fields']),
+            {'first_name', 'last_name', 'username', 'password'}
+        )
+        self.assertEqual(TaskChange.objects.count(), changes_count)
+        self.assertTrue(
+            User.objects.get(pk=self.user2.pk).check_password('secret')
+        )
+
     def test_user_delete_get(self):
         self.client.force_login(self.user1)
         response = self.client.get(
@@ -134,6 +164,19 @@ class UsersTest(TestCase):
         with self.assertRaises(ObjectDoesNotExist):
             User.objects.get(id=self.user3.id)
 
+    def test_user_update_and_delete_queries(self):
+        self.client.force_login(self.user3)
+        with self.assertNumQueries(3):
+            self.client.get(reverse_lazy('user_update', args=[self.user3.id]))
+        with self.assertNumQueries(3):
+            self.client.get(reverse_lazy('user_delete', args=[self.user3.id]))
+        with self.assertNumQueries(10):
+            response = self.client.post(
+                reverse_lazy('user_delete', args=[self.user3.id])
+            )
+
+        self.assertRedirects(response, reverse_lazy('users'))
+
     def test_user_delete_linked(self):
         self.client.force_login(self.user2)
         before_objs_len = len(User.objects.all())
@@ -146,3 +189,79 @@ class UsersTest(TestCase):
             expected_exception=ProtectedError,
             expected_message=texts.messages['no_rights']
         )
+
+    def test_users_usage_count(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse_lazy('users'))
+
+        self.assertEqual(
+            [user.usage_count for user in response.context['users']],
+            [2, 3, 0]
+        )
+
+    def test_user_delete_linked_without_collector(self):
+        self.client.force_login(self.user2)
+        with patch.object(Collector, 'collect') as collect:
+            response = self.client.post(
+                reverse_lazy('user_delete', args=[self.user2.id])
+            )
+
+        collect.assert_not_called()
+        self.assertRedirects(response, reverse_lazy('users'))
+        self.assertEqual(
+            [str(message) for message in get_messages(response.wsgi_request)],
+            [texts.messages['protected_user']]
+        )
+
+    @patch.object(UsersListView, 'paginate_by', 2)
+    def test_users_pagination(self):
+        response = self.client.get(reverse_lazy('users'))
+        page = response.context['page_obj']
+
+        self.assertEqual(list(response.context['users']),
+                         [self.user1, self.user2])
+
+        response = self.client.get(
+            reverse_lazy('users'), {'cursor': page.next_cursor}
+        )
+
+        self.assertEqual(list(response.context['users']), [self.user3])
+        self.assertFalse(response.context['page_obj'].has_next())
+
+    def test_users_search(self):
+        response = self.client.get(reverse_lazy('users'), {'q': 'niels ab'})
+        self.assertEqual(list(response.context['users']), [self.user2])
+
+        response = self.client.get(reverse_lazy('users'), {'q': 'ferm'})
+        self.assertEqual(list(response.context['users']), [self.user3])
+
+        response = self.client.get(reverse_lazy('users'), {'q': 'abel x'})
+        self.assertEqual(list(response.context['users']), [])
+
+    def test_users_queries_do_not_grow_with_users(self):
+        with self.assertNumQueries(1):
+            self.client.get(reverse_lazy('users'))
+        User.objects.bulk_create(
+            User(username=f'user{number}') for number in range(60)
+        )
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse_lazy('users'))
+
+        self.assertEqual(len(response.context['users']), 50)
+        self.assertTrue(response.context['page_obj'].has_next())
+
+    @override_settings(STATICFILES_STORAGE=(
+        'django.contrib.staticfiles.storage.StaticFilesStorage'
+    ))
+    def test_admin_user_search(self):
+        self.client.force_login(
+            User.objects.create_superuser('admin', password='admin')
+        )
+
+        response = self.client.get(
+            reverse_lazy('admin:users_user_changelist'), {'q': 'ferm'}
+        )
+
+        self.assertEqual(
+            list(response.context['cl'].result_list), [self.user3]
+        )
@@ -1,9 +1,14 @@
 from django.urls import path
 
+from task_manager.async_views import select_view
 from task_manager.users import views
 
 urlpatterns = [
-    path('', views.UsersListView.as_view(), name='users'),
+    path(
+        '',
+        select_view(views.UsersListView, views.AsyncUsersListView).as_view(),
+        name='users'
+    ),
     path('create/', views.UserCreateView.as_view(), name='create'),
     path(
         '<int:pk>/update/',
@@ -3,10 +3,15 @@ from django.urls import reverse_lazy
 from django.views.generic import CreateView, ListView, UpdateView, DeleteView
 
 from task_manager import texts
+from task_manager.async_views import AsyncListView
+from task_manager.autocomplete import prefix_search
 from task_manager.mixins import (AuthCheckMixin,
                                  PermissionCheckMixin,
-                                 ProtectDeleteMixin
+                                 ProtectDeleteMixin,
+                                 ReplicaReadMixin,
+                                 UsageCountMixin
                                  )
+from task_manager.pagination import KeysetPaginationMixin
 from task_manager.users.forms import UserForm, UpdateUserForm
 from task_manager.users.models import User
 
@@ -24,15 +29,37 @@ class UserCreateView(SuccessMessageMixin, CreateView):
     success_message = texts.messages['user_created']
 
 
-class UsersListView(ListView):
+class UsersListMixin(
+    ReplicaReadMixin, UsageCountMixin, KeysetPaginationMixin
+):
     template_name = 'users/list.html'
     model = User
     context_object_name = 'users'
+    cursor_ordering = ('id',)
+    search_fields = ('first_name', 'last_name', 'username')
     extra_context = {
         'basic': texts.basic,
         'list': texts.users_list,
+        'pagination': texts.pagination,
+        'button_text': texts.buttons['demonstrate'],
     }
 
+    def get_queryset(self):
+        return prefix_search(
+            super().get_queryset(),
+            self.search_fields,
+            self.request.GET.get('q', ''),
+            words=True,
+        )
+
+
+class UsersListView(UsersListMixin, ListView):
+    pass
+
+
+class AsyncUsersListView(UsersListMixin, AsyncListView):
+    pass
+
 
 class UserUpdateView(
     AuthCheckMixin,
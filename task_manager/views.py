@@ -1,13 +1,19 @@
+from secrets import compare_digest
+
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.forms import AuthenticationForm
 from django.contrib.auth.views import LoginView, LogoutView
 from django.contrib.messages.views import SuccessMessageMixin
-from django.http import HttpResponseRedirect
+from django.http import (
+    Http404, HttpResponse, HttpResponseForbidden, HttpResponseRedirect,
+)
 from django.urls import reverse_lazy
 from django.utils.translation import activate
-from django.views.generic.base import TemplateView
+from django.views.generic.base import TemplateView, View
 
 from task_manager import texts
+from task_manager.metrics import registry
 
 
 def set_language(request, language):
@@ -56,3 +62,22 @@ class Error500View(BasicView):
 
 class Error404View(BasicView):
     template_name = './errors/error_404.html'
+
+
+class MetricsView(View):
+    content_type = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def get(self, request, *args, **kwargs):
+        if not settings.METRICS_ENABLED:
+            raise Http404
+        if not self.has_access(request):
+            return HttpResponseForbidden()
+        return HttpResponse(registry.render(), content_type=self.content_type)
+
+    @staticmethod
+    def has_access(request):
+        token = settings.METRICS_TOKEN
+        header = request.headers.get('Authorization', '')
+        if token and compare_digest(header, f'Bearer {token}'):
+            return True
+        return request.user.is_staff
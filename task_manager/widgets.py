@@ -0,0 +1,47 @@
+from django import forms
+from django.core.exceptions import ValidationError
+from django.urls import reverse_lazy
+
+from task_manager.refdata import lookup
+
+
+class AutocompleteMixin:
+
+    def __init__(self, url_name, attrs=None):
+        super().__init__(attrs)
+        self.url_name = url_name
+
+    def build_attrs(self, base_attrs, extra_attrs=None):
+        attrs = super().build_attrs(base_attrs, extra_attrs)
+        attrs['data-autocomplete-url'] = reverse_lazy(self.url_name)
+        return attrs
+
+    def optgroups(self, name, value, attrs=None):
+        choices = self.choices
+        self.choices = self.selected_choices(value)
+        try:
+            return super().optgroups(name, value, attrs)
+        finally:
+            self.choices = choices
+
+    def selected_choices(self, value):
+        choices = []
+        if not self.allow_multiple_selected:
+            empty_label = self.choices.field.empty_label
+            choices.append(('', empty_label or ''))
+        selected = [item for item in value if item]
+        if not selected:
+            return choices
+        try:
+            objects = lookup(self.choices.queryset, selected)
+        except (ValueError, ValidationError):
+            return choices
+        return choices + [self.choices.choice(obj) for obj in objects]
+
+
+class AutocompleteSelect(AutocompleteMixin, forms.Select):
+    pass
+
+
+class AutocompleteSelectMultiple(AutocompleteMixin, forms.SelectMultiple):
+    pass